@@ -9,13 +9,209 @@
 #
 # This will create presidents_day_2026_tournament.csv in the same folder.
 
-import csv
+import json
+
 import pyodbc
 
 from scrape_gc_schedules import DB_CONNECTION_STRING
 from presidents_day_teams import TOURNAMENT_TEAMS
 
 
+# Resolved once per process: the exact ODBC type of GCGamesTmp4.SourceTeamID,
+# so bound parameters match the column and the plan never needs a
+# CONVERT_IMPLICIT (which would defeat an index seek on the column).
+_TEAM_ID_INPUTSIZE = None
+
+
+def _team_id_inputsize(cursor):
+    """Return the (sql_type, size, scale) tuple matching SourceTeamID."""
+    global _TEAM_ID_INPUTSIZE
+    if _TEAM_ID_INPUTSIZE is None:
+        cursor.execute(
+            """
+            SELECT DATA_TYPE, CHARACTER_MAXIMUM_LENGTH
+              FROM INFORMATION_SCHEMA.COLUMNS
+             WHERE TABLE_NAME = 'GCGamesTmp4'
+               AND COLUMN_NAME = 'SourceTeamID'
+            """
+        )
+        row = cursor.fetchone()
+        sql_types = {
+            "char": pyodbc.SQL_CHAR,
+            "varchar": pyodbc.SQL_VARCHAR,
+            "nchar": pyodbc.SQL_WCHAR,
+            "nvarchar": pyodbc.SQL_WVARCHAR,
+        }
+        if row and row.DATA_TYPE in sql_types:
+            _TEAM_ID_INPUTSIZE = (
+                sql_types[row.DATA_TYPE],
+                row.CHARACTER_MAXIMUM_LENGTH or 50,
+                0,
+            )
+        else:
+            # Column missing or exotic type – fall back to the DDL default
+            _TEAM_ID_INPUTSIZE = (pyodbc.SQL_VARCHAR, 50, 0)
+    return _TEAM_ID_INPUTSIZE
+
+
+def fetch_tournament_stats(cursor, team_ids: list) -> dict:
+    """
+    Aggregate G, W, L, RS, RA for every tournament TeamID in ONE query,
+    joined to GCTeams for the canonical name.
+
+    One GROUP BY round trip replaces the old 2-queries-per-team loop
+    (name lookup + per-game fetch), so SQL Server plans a single hash
+    aggregate instead of N cursor round trips.
+
+    Returns {team_id: {"TeamName": ..., "G": ..., "W": ..., "L": ...,
+                       "RS": ..., "RA": ...}}.
+    """
+    if not team_ids:
+        return {}
+
+    # Pin the parameter types to the actual column type so pyodbc prepares
+    # one stable plan (no sp_prepexec churn) and the server never inserts a
+    # CONVERT_IMPLICIT between parameter and index.
+    inputsize = _team_id_inputsize(cursor)
+    placeholders = ", ".join(["?"] * len(team_ids))
+    cursor.setinputsizes([inputsize] * len(team_ids))
+    cursor.execute(
+        f"""
+        SELECT g.SourceTeamID,
+               COALESCE(MAX(t.TeamName), g.SourceTeamID) AS TeamName,
+               COUNT(*) AS G,
+               SUM(CASE WHEN (g.HomeTeamID = g.SourceTeamID
+                              AND COALESCE(g.HomeScore, 0) > COALESCE(g.AwayScore, 0))
+                         OR (g.AwayTeamID = g.SourceTeamID
+                              AND COALESCE(g.AwayScore, 0) > COALESCE(g.HomeScore, 0))
+                        THEN 1 ELSE 0 END) AS W,
+               SUM(CASE WHEN (g.HomeTeamID = g.SourceTeamID
+                              AND COALESCE(g.HomeScore, 0) < COALESCE(g.AwayScore, 0))
+                         OR (g.AwayTeamID = g.SourceTeamID
+                              AND COALESCE(g.AwayScore, 0) < COALESCE(g.HomeScore, 0))
+                        THEN 1 ELSE 0 END) AS L,
+               SUM(CASE WHEN g.HomeTeamID = g.SourceTeamID
+                        THEN COALESCE(g.HomeScore, 0) ELSE COALESCE(g.AwayScore, 0) END) AS RS,
+               SUM(CASE WHEN g.HomeTeamID = g.SourceTeamID
+                        THEN COALESCE(g.AwayScore, 0) ELSE COALESCE(g.HomeScore, 0) END) AS RA
+          FROM GCGamesTmp4 g
+          LEFT JOIN GCTeams t
+            ON t.TeamID = g.SourceTeamID
+         WHERE g.SourceTeamID IN ({placeholders})
+         GROUP BY g.SourceTeamID
+        """,
+        *team_ids,
+    )
+
+    stats_by_id = {}
+    for row in cursor.fetchall():
+        stats_by_id[row.SourceTeamID] = {
+            "TeamName": row.TeamName,
+            "G": row.G or 0,
+            "W": row.W or 0,
+            "L": row.L or 0,
+            "RS": row.RS or 0,
+            "RA": row.RA or 0,
+        }
+    return stats_by_id
+
+
+def fetch_tournament_rows(cursor, teams: list) -> list:
+    """
+    Produce the final CSV-shaped rows (Team/Pool/G/W/L/RS/RA) in ONE round
+    trip: the whole TOURNAMENT_TEAMS list travels to the server as a JSON
+    table via OPENJSON, gets LEFT JOINed to GCTeams and GCGamesTmp4, and
+    comes back aggregated and ordered. Teams with no scraped games come back
+    with zeroed stats and their label (or GCTeams name) intact.
+    """
+    teams_json = json.dumps(
+        [
+            {
+                "ord": i,
+                "team_id": e["team_id"],
+                "pool": e["pool"],
+                "label": e.get("label", e["team_id"]),
+            }
+            for i, e in enumerate(teams)
+        ]
+    )
+
+    cursor.execute(
+        """
+        SELECT COALESCE(MAX(t.TeamName), MAX(j.Label), j.TeamID) AS Team,
+               j.Pool,
+               COUNT(g.GameID) AS G,
+               COALESCE(SUM(CASE WHEN (g.HomeTeamID = j.TeamID
+                                       AND COALESCE(g.HomeScore, 0) > COALESCE(g.AwayScore, 0))
+                                  OR (g.AwayTeamID = j.TeamID
+                                       AND COALESCE(g.AwayScore, 0) > COALESCE(g.HomeScore, 0))
+                                 THEN 1 ELSE 0 END), 0) AS W,
+               COALESCE(SUM(CASE WHEN (g.HomeTeamID = j.TeamID
+                                       AND COALESCE(g.HomeScore, 0) < COALESCE(g.AwayScore, 0))
+                                  OR (g.AwayTeamID = j.TeamID
+                                       AND COALESCE(g.AwayScore, 0) < COALESCE(g.HomeScore, 0))
+                                 THEN 1 ELSE 0 END), 0) AS L,
+               COALESCE(SUM(CASE WHEN g.HomeTeamID = j.TeamID
+                                 THEN COALESCE(g.HomeScore, 0)
+                                 ELSE COALESCE(g.AwayScore, 0) END), 0) AS RS,
+               COALESCE(SUM(CASE WHEN g.HomeTeamID = j.TeamID
+                                 THEN COALESCE(g.AwayScore, 0)
+                                 ELSE COALESCE(g.HomeScore, 0) END), 0) AS RA
+          FROM OPENJSON(?)
+               WITH (
+                   Ord    INT           '$.ord',
+                   TeamID VARCHAR(50)   '$.team_id',
+                   Pool   VARCHAR(16)   '$.pool',
+                   Label  NVARCHAR(200) '$.label'
+               ) j
+          LEFT JOIN GCTeams t
+            ON t.TeamID = j.TeamID
+          LEFT JOIN GCGamesTmp4 g
+            ON g.SourceTeamID = j.TeamID
+         GROUP BY j.Ord, j.TeamID, j.Pool
+         ORDER BY j.Ord
+        """,
+        teams_json,
+    )
+
+    return [
+        {
+            "Team": r.Team,
+            "Pool": r.Pool,
+            "G": r.G,
+            "W": r.W,
+            "L": r.L,
+            "RS": r.RS,
+            "RA": r.RA,
+        }
+        for r in cursor.fetchall()
+    ]
+
+
+def fetch_team_names(cursor, team_ids: list) -> dict:
+    """
+    Look up canonical TeamNames from GCTeams for a whole list of GC TeamIDs
+    in one query, returning {team_id: team_name}.
+
+    Replaces N fetch_team_name round trips with a single IN-list lookup;
+    IDs with no GCTeams row are simply absent from the result.
+    """
+    if not team_ids:
+        return {}
+
+    placeholders = ", ".join(["?"] * len(team_ids))
+    cursor.setinputsizes([_team_id_inputsize(cursor)] * len(team_ids))
+    cursor.execute(
+        f"""
+        SELECT TeamID, TeamName
+          FROM GCTeams
+         WHERE TeamID IN ({placeholders})
+        """,
+        *team_ids,
+    )
+    return {r.TeamID: r.TeamName for r in cursor.fetchall() if r.TeamName}
+
+
 def fetch_team_name(cursor, team_id: str, label_fallback: str) -> str:
     """
     Get the canonical TeamName from GCTeams for a given GC TeamID.
@@ -40,87 +236,68 @@ def aggregate_team_stats_by_id(cursor, team_id: str) -> dict:
     """
     Aggregate G, W, L, RS, RA for a given GC TeamID using GCGamesTmp4,
     matching on SourceTeamID (the GC team id we scraped from).
+
+    The aggregation happens entirely in SQL (SUM over CASE expressions),
+    so only one 5-column row crosses the wire instead of every game.
+    Ties count as games but don't change W/L, same as before.
     """
+    cursor.setinputsizes([_team_id_inputsize(cursor)] * 7)
     cursor.execute(
         """
-        SELECT GameDate,
-               HomeTeamID,
-               AwayTeamID,
-               HomeScore,
-               AwayScore,
-               SourceTeamID
+        SELECT COUNT(*) AS G,
+               SUM(CASE WHEN (HomeTeamID = ? AND COALESCE(HomeScore, 0) > COALESCE(AwayScore, 0))
+                         OR (AwayTeamID = ? AND COALESCE(AwayScore, 0) > COALESCE(HomeScore, 0))
+                        THEN 1 ELSE 0 END) AS W,
+               SUM(CASE WHEN (HomeTeamID = ? AND COALESCE(HomeScore, 0) < COALESCE(AwayScore, 0))
+                         OR (AwayTeamID = ? AND COALESCE(AwayScore, 0) < COALESCE(HomeScore, 0))
+                        THEN 1 ELSE 0 END) AS L,
+               SUM(CASE WHEN HomeTeamID = ?
+                        THEN COALESCE(HomeScore, 0) ELSE COALESCE(AwayScore, 0) END) AS RS,
+               SUM(CASE WHEN HomeTeamID = ?
+                        THEN COALESCE(AwayScore, 0) ELSE COALESCE(HomeScore, 0) END) AS RA
           FROM GCGamesTmp4
          WHERE SourceTeamID = ?
         """,
-        team_id,
+        team_id, team_id, team_id, team_id, team_id, team_id, team_id,
     )
 
-    rows = cursor.fetchall()
-
-    G = W = L = RS = RA = 0
-
-    for g in rows:
-        home_id = g.HomeTeamID
-        away_id = g.AwayTeamID
-        home_score = g.HomeScore or 0
-        away_score = g.AwayScore or 0
-
-        # Determine if this team was home or away in this game
-        is_home = (home_id == team_id)
-
-        team_runs = home_score if is_home else away_score
-        opp_runs = away_score if is_home else home_score
-
-        RS += team_runs
-        RA += opp_runs
-        G += 1
-
-        if team_runs > opp_runs:
-            W += 1
-        elif team_runs < opp_runs:
-            L += 1
-        # ties count as games but don't change W/L
-
-    return {"G": G, "W": W, "L": L, "RS": RS, "RA": RA}
+    row = cursor.fetchone()
+    return {
+        "G": row.G or 0,
+        "W": row.W or 0,
+        "L": row.L or 0,
+        "RS": row.RS or 0,
+        "RA": row.RA or 0,
+    }
 
 
 def build_tournament_csv(output_path: str = "presidents_day_2026_tournament.csv"):
+    # Everything – IDs in, aggregated rows out – happens in one round trip.
     conn = pyodbc.connect(DB_CONNECTION_STRING)
-    cursor = conn.cursor()
-
-    output_rows = []
+    # Read-only workload: autocommit skips the implicit transaction that
+    # would otherwise wrap each statement.
+    conn.autocommit = True
+    try:
+        output_rows = fetch_tournament_rows(conn.cursor(), TOURNAMENT_TEAMS)
+    finally:
+        conn.close()
 
-    for entry in TOURNAMENT_TEAMS:
-        team_id = entry["team_id"]
-        pool = entry["pool"]
-        label = entry.get("label", team_id)
+    # The schema is small and fixed and every field except Team is an int,
+    # so plain f-strings beat csv.DictWriter's per-cell dispatch. Team names
+    # that need escaping (comma/quote/newline) get the standard CSV quoting.
+    def csv_safe(team: str) -> str:
+        if any(c in team for c in ',"\n'):
+            return '"' + team.replace('"', '""') + '"'
+        return team
 
-        # Step 1: get the best-known TeamName for this GC TeamID
-        resolved_name = fetch_team_name(cursor, team_id, label)
-
-        # Step 2: aggregate stats by that name
-        stats = aggregate_team_stats_by_id(cursor, team_id)
-
-        output_rows.append(
-            {
-                "Team": resolved_name,
-                "Pool": pool,
-                "G": stats["G"],
-                "W": stats["W"],
-                "L": stats["L"],
-                "RS": stats["RS"],
-                "RA": stats["RA"],
-            }
-        )
-
-    conn.close()
+    lines = ["Team,Pool,G,W,L,RS,RA\n"]
+    lines.extend(
+        f"{csv_safe(r['Team'])},{r['Pool']},{r['G']},{r['W']},{r['L']},{r['RS']},{r['RA']}\n"
+        for r in output_rows
+    )
 
-    fieldnames = ["Team", "Pool", "G", "W", "L", "RS", "RA"]
     with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in output_rows:
-            writer.writerow(r)
+        f.writelines(lines)
 
     print(f"✅ Tournament CSV written to {output_path}")
     print("   You can now upload this into tournament.html.")
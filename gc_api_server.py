@@ -1,14 +1,45 @@
 import io
 import csv
+import hashlib
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import pyodbc
-from flask import Flask, Response, send_from_directory, request, jsonify
+
+try:
+    import orjson  # SIMD-accelerated JSON encoder; optional
+except ImportError:
+    orjson = None
+
+from flask import (
+    Flask,
+    Response,
+    send_from_directory,
+    request,
+    jsonify,
+    stream_with_context,
+)
 
 from scrape_gc_schedules import DB_CONNECTION_STRING  # uses your .env
-from build_tournament_csv import fetch_team_name, aggregate_team_stats_by_id  # reuse your logic
+from build_tournament_csv import fetch_tournament_stats, fetch_team_names  # reuse your logic
 from presidents_day_teams import TOURNAMENT_TEAMS  # your pool/team definitions
 
+# Flatten the team dicts once at import so the per-request loop iterates a
+# tuple of (team_id, pool, label) tuples instead of doing dict lookups.
+_TEAM_ROWS = tuple(
+    (e["team_id"], e["pool"], e.get("label", e["team_id"]))
+    for e in TOURNAMENT_TEAMS
+)
+_TEAM_IDS = [team_id for team_id, _pool, _label in _TEAM_ROWS]
+
+# CSV header, encoded once at import (csv.writer line ending included).
+# Under gunicorn, start with --preload so this module-level state is built
+# once in the master and COW-shared across workers.
+_CSV_HEADER_BYTES = b"Team,Pool,G,W,L,RS,RA\r\n"
+
 # -----------------------------------------------------------------------------
 # Paths / Flask app
 # -----------------------------------------------------------------------------
@@ -23,6 +54,75 @@ app = Flask(
 )
 
 
+# -----------------------------------------------------------------------------
+# DB connection pool
+# -----------------------------------------------------------------------------
+#
+# Opening a fresh pyodbc connection per request pays ODBC driver init plus a
+# full TLS/auth handshake on every hit. Keep a small pool of long-lived
+# connections instead and hand them out via a context manager.
+
+POOL_SIZE = 8
+_conn_pool = queue.Queue(maxsize=POOL_SIZE)
+_conn_count = 0
+_conn_count_lock = threading.Lock()
+
+
+def _new_connection():
+    conn = pyodbc.connect(DB_CONNECTION_STRING)
+    conn.setencoding("utf-8")
+    return conn
+
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a pooled connection; create one lazily if the pool is empty and
+    we are below POOL_SIZE. Connections that raise pyodbc.Error are assumed
+    broken and discarded; every other exit — including GeneratorExit when a
+    client aborts a streamed response mid-yield — returns the connection to
+    the pool, so no exit path can strand a slot.
+    """
+    global _conn_count
+    try:
+        conn = _conn_pool.get_nowait()
+    except queue.Empty:
+        with _conn_count_lock:
+            reserved = _conn_count < POOL_SIZE
+            if reserved:
+                _conn_count += 1
+        if reserved:
+            try:
+                conn = _new_connection()
+            except BaseException:
+                # Failed connect: release the slot we reserved above so the
+                # count only ever reflects connections that actually exist.
+                with _conn_count_lock:
+                    _conn_count -= 1
+                raise
+        else:
+            conn = _conn_pool.get()
+
+    broken = False
+    try:
+        yield conn
+    except pyodbc.Error:
+        # Connection may be broken (server restart, network drop) – drop it
+        # and let the next request open a fresh one.
+        broken = True
+        raise
+    finally:
+        if broken:
+            try:
+                conn.close()
+            except pyodbc.Error:
+                pass
+            with _conn_count_lock:
+                _conn_count -= 1
+        else:
+            _conn_pool.put(conn)
+
+
 # -----------------------------------------------------------------------------
 # Static site
 # -----------------------------------------------------------------------------
@@ -37,31 +137,57 @@ def root():
 # API: Tournament CSV (for tournament.html threat board)
 # -----------------------------------------------------------------------------
 
-@app.route("/api/tournament.csv")
-def api_tournament_csv():
+# In-process cache for the tournament CSV. GCGamesTmp4 only changes when a
+# scrape runs, so rebuilding (and re-querying SQL Server) on every hit is
+# wasted work; serve the same bytes for up to CSV_CACHE_TTL seconds.
+CSV_CACHE_TTL = 60  # seconds
+# ts starts one full TTL in the past: time.monotonic() can be < TTL right
+# after boot, and a 0.0 start would make the empty cache look fresh.
+_csv_cache = {"ts": -CSV_CACHE_TTL, "etag": None, "body": b""}
+_csv_cache_lock = threading.Lock()
+
+
+def _tournament_csv_lines(conn):
     """
-    Return a CSV in the same format your threat board expects:
-      Team,Pool,G,W,L,RS,RA
+    Yield CSV lines (header first) one at a time, already UTF-8 encoded.
 
-    Backed directly by GCGamesTmp4 via the same logic as build_tournament_csv.py.
+    Rows go through a tiny reusable StringIO + csv.writer so team names with
+    commas/quotes still escape correctly, without buffering the whole file.
+    Yielding bytes means neither Flask nor the cache path re-encodes the
+    payload later.
     """
-    conn = pyodbc.connect(DB_CONNECTION_STRING)
     cursor = conn.cursor()
 
     buffer = io.StringIO()
     writer = csv.writer(buffer)
-    writer.writerow(["Team", "Pool", "G", "W", "L", "RS", "RA"])
 
-    for entry in TOURNAMENT_TEAMS:
-        team_id = entry["team_id"]
-        pool = entry["pool"]
-        label = entry.get("label", team_id)
+    def emit(row):
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerow(row)
+        return buffer.getvalue().encode("utf-8")
+
+    yield _CSV_HEADER_BYTES
+
+    # One set-based query for every tournament team (same helper as the
+    # CSV builder) instead of 2 round trips per team.
+    stats_by_id = fetch_tournament_stats(cursor, _TEAM_IDS)
+
+    # Batched name lookup for teams with no scraped games yet
+    names_by_id = fetch_team_names(
+        cursor,
+        [team_id for team_id in _TEAM_IDS if team_id not in stats_by_id],
+    )
 
-        # Use your existing helpers to stay consistent with the CSV builder
-        team_name = fetch_team_name(cursor, team_id, label)
-        stats = aggregate_team_stats_by_id(cursor, team_id)
+    for team_id, pool, label in _TEAM_ROWS:
+        stats = stats_by_id.get(team_id)
+        if stats:
+            team_name = stats["TeamName"] or label or team_id
+        else:
+            team_name = names_by_id.get(team_id) or label or team_id
+            stats = {"G": 0, "W": 0, "L": 0, "RS": 0, "RA": 0}
 
-        writer.writerow([
+        yield emit([
             team_name,
             pool,
             stats["G"],
@@ -71,10 +197,49 @@ def api_tournament_csv():
             stats["RA"],
         ])
 
-    conn.close()
 
-    csv_text = buffer.getvalue()
-    return Response(csv_text, mimetype="text/csv")
+@app.route("/api/tournament.csv")
+def api_tournament_csv():
+    """
+    Return a CSV in the same format your threat board expects:
+      Team,Pool,G,W,L,RS,RA
+
+    Backed directly by GCGamesTmp4 via the same logic as build_tournament_csv.py.
+    Cache hits serve the same bytes (with an ETag) for CSV_CACHE_TTL seconds;
+    cache misses stream rows to the client as they are produced, refilling the
+    cache as a side effect, so time-to-first-byte is ~one query latency.
+    """
+    with _csv_cache_lock:
+        fresh = (
+            _csv_cache["etag"] is not None
+            and time.monotonic() - _csv_cache["ts"] < CSV_CACHE_TTL
+        )
+        body = _csv_cache["body"]
+        etag = _csv_cache["etag"]
+
+    if fresh:
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=304, headers={"ETag": etag})
+        return Response(
+            body,
+            mimetype="text/csv",
+            headers={"ETag": etag, "Content-Length": str(len(body))},
+        )
+
+    def gen():
+        chunks = []
+        with get_conn() as conn:
+            for line in _tournament_csv_lines(conn):
+                chunks.append(line)
+                yield line
+
+        new_body = b"".join(chunks)
+        with _csv_cache_lock:
+            _csv_cache["body"] = new_body
+            _csv_cache["etag"] = hashlib.md5(new_body).hexdigest()
+            _csv_cache["ts"] = time.monotonic()
+
+    return Response(stream_with_context(gen()), mimetype="text/csv")
 
 
 # -----------------------------------------------------------------------------
@@ -94,92 +259,92 @@ def api_team_hitting():
     if not team_id:
         return jsonify({"error": "team_id is required"}), 400
 
-    conn = pyodbc.connect(DB_CONNECTION_STRING)
+    with get_conn() as conn:
+        players = _fetch_team_hitting(conn, team_id)
+
+    # Rows are plain ints/floats/strs straight from SQL, so orjson can
+    # serialize them directly when available; fall back to jsonify.
+    if orjson is not None:
+        return Response(orjson.dumps(players), mimetype="application/json")
+    return jsonify(players)
+
+
+# JSON keys for the hitting payload, in the same order as the SELECT list
+# in _fetch_team_hitting below.
+HITTING_COLS = (
+    "name", "AB", "R", "H", "RBI", "BB", "SO",
+    "2B", "3B", "HR", "SB", "TB", "PA",
+    "AVG", "OBP", "SLG", "OPS", "ISO",
+)
+
+
+def _fetch_team_hitting(conn, team_id: str) -> list:
     cursor = conn.cursor()
 
-    # Aggregate per-player totals for that team.
-    # We only include rows where TeamMatch = 'Yes' so we don't mix in opponent stats.
+    # Aggregate per-player totals for that team and derive every rate stat
+    # server-side, so rows come back ready for jsonify with no per-row
+    # Python arithmetic. We only include rows where TeamMatch = 'Yes' so we
+    # don't mix in opponent stats.
+    #
+    # Notes on the SQL:
+    #   - singles is clamped at 0 in case the extra-stats breakdown exceeds H
+    #     (bad source data), matching the old Python guard.
+    #   - PA = AB + BB is a simple approximation (no HBP/SF tracked yet).
     cursor.execute(
         """
         SELECT
             PlayerName,
-            SUM(AB)          AS AB,
-            SUM(R)           AS R,
-            SUM(H)           AS H,
-            SUM(RBI)         AS RBI,
-            SUM(BB)          AS BB,
-            SUM(SO)          AS SO,
-            SUM(Doubles)     AS Doubles,
-            SUM(Triples)     AS Triples,
-            SUM(HomeRuns)    AS HomeRuns,
-            SUM(StolenBases) AS StolenBases
-        FROM GCBattingStatsTmp4
-        WHERE TeamID = ? AND TeamMatch = 'Yes'
-        GROUP BY PlayerName
+            AB, R, H, RBI, BB, SO,
+            Doubles, Triples, HomeRuns, StolenBases,
+            TB,
+            PA,
+            ROUND(AVG_, 3) AS AVG_,
+            ROUND(OBP, 3)  AS OBP,
+            ROUND(SLG, 3)  AS SLG,
+            ROUND(OBP + SLG, 3) AS OPS,
+            ROUND(SLG - AVG_, 3) AS ISO
+        FROM (
+            SELECT
+                totals.*,
+                CASE WHEN AB > 0 THEN CAST(H AS float) / AB ELSE 0.0 END AS AVG_,
+                CASE WHEN PA > 0 THEN CAST(H + BB AS float) / PA ELSE 0.0 END AS OBP,
+                CASE WHEN AB > 0 THEN CAST(TB AS float) / AB ELSE 0.0 END AS SLG
+            FROM (
+                SELECT
+                    PlayerName,
+                    COALESCE(SUM(AB), 0)          AS AB,
+                    COALESCE(SUM(R), 0)           AS R,
+                    COALESCE(SUM(H), 0)           AS H,
+                    COALESCE(SUM(RBI), 0)         AS RBI,
+                    COALESCE(SUM(BB), 0)          AS BB,
+                    COALESCE(SUM(SO), 0)          AS SO,
+                    COALESCE(SUM(Doubles), 0)     AS Doubles,
+                    COALESCE(SUM(Triples), 0)     AS Triples,
+                    COALESCE(SUM(HomeRuns), 0)    AS HomeRuns,
+                    COALESCE(SUM(StolenBases), 0) AS StolenBases,
+                    CASE WHEN COALESCE(SUM(H), 0) - COALESCE(SUM(Doubles), 0)
+                              - COALESCE(SUM(Triples), 0) - COALESCE(SUM(HomeRuns), 0) > 0
+                         THEN COALESCE(SUM(H), 0) - COALESCE(SUM(Doubles), 0)
+                              - COALESCE(SUM(Triples), 0) - COALESCE(SUM(HomeRuns), 0)
+                         ELSE 0 END
+                      + 2 * COALESCE(SUM(Doubles), 0)
+                      + 3 * COALESCE(SUM(Triples), 0)
+                      + 4 * COALESCE(SUM(HomeRuns), 0) AS TB,
+                    COALESCE(SUM(AB), 0) + COALESCE(SUM(BB), 0) AS PA
+                FROM GCBattingStatsTmp4
+                WHERE TeamID = ? AND TeamMatch = 'Yes'
+                GROUP BY PlayerName
+            ) totals
+        ) rates
         ORDER BY PlayerName
         """,
         team_id,
     )
 
-    rows = cursor.fetchall()
-
-    players = []
-
-    for row in rows:
-        # Base counting stats
-        name        = row.PlayerName
-        AB          = row.AB or 0
-        R           = row.R or 0
-        H           = row.H or 0
-        RBI         = row.RBI or 0
-        BB          = row.BB or 0
-        SO          = row.SO or 0
-        doubles     = row.Doubles or 0
-        triples     = row.Triples or 0
-        HR          = row.HomeRuns or 0
-        SB          = row.StolenBases or 0
-
-        # Derive singles and total bases from breakdown
-        singles = H - (doubles + triples + HR)
-        if singles < 0:
-            singles = 0  # just in case of bad source data
-
-        TB = singles + doubles * 2 + triples * 3 + HR * 4
-
-        # Derived counts
-        PA = AB + BB  # simple approximation (no HBP/SF tracked yet)
-
-        # Rate stats (with zero-division protection)
-        AVG = H / AB if AB > 0 else 0.0
-        OB  = H + BB
-        OBP = OB / PA if PA > 0 else 0.0
-        SLG = TB / AB if AB > 0 else 0.0
-        OPS = OBP + SLG
-        ISO = SLG - AVG
-
-        players.append({
-            "name":  name,
-            "AB":    AB,
-            "R":     R,
-            "H":     H,
-            "RBI":   RBI,
-            "BB":    BB,
-            "SO":    SO,
-            "2B":    doubles,
-            "3B":    triples,
-            "HR":    HR,
-            "SB":    SB,
-            "TB":    TB,
-            "PA":    PA,
-            "AVG":   round(AVG, 3),
-            "OBP":   round(OBP, 3),
-            "SLG":   round(SLG, 3),
-            "OPS":   round(OPS, 3),
-            "ISO":   round(ISO, 3),
-        })
-
-    conn.close()
-    return jsonify(players)
+    # Column order is fixed by the SELECT above, so zip positionally with
+    # the JSON keys — no per-row pyodbc attribute lookups or `or 0` guards
+    # (COALESCE already guarantees non-null ints).
+    return [dict(zip(HITTING_COLS, row)) for row in cursor]
 
 
 # -----------------------------------------------------------------------------
@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
 import os
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 
+import httpx
 from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -30,6 +35,39 @@ IMPLICIT_WAIT = 15
 
 TEAM_SCHEDULE_URL = "https://web.gc.com/teams/QQpfJzkSUSyd/2025-fall-delmarva-aces-12u-east/schedule"
 
+# ---------------------------------------------------------------------
+# On-disk HTML snapshot cache (enable with --use-cache)
+#
+# When iterating on parser code there's no reason to re-drive Chrome /
+# re-download pages that haven't changed; snapshots keyed by URL hash
+# turn a ~30s Selenium cycle into a parser-only rerun.
+# ---------------------------------------------------------------------
+
+USE_CACHE = "--use-cache" in sys.argv
+CACHE_DIR = Path("html-cache")
+CACHE_TTL = 3600  # seconds
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.html"
+
+
+def cached_html(url: str):
+    """Return a fresh-enough snapshot for url, or None."""
+    if not USE_CACHE:
+        return None
+    p = _cache_path(url)
+    if p.exists() and time.time() - p.stat().st_mtime < CACHE_TTL:
+        return p.read_text(encoding="utf-8")
+    return None
+
+
+def store_html(url: str, html: str):
+    if not USE_CACHE or not html:
+        return
+    CACHE_DIR.mkdir(exist_ok=True)
+    _cache_path(url).write_text(html, encoding="utf-8")
+
 
 # ---------------------------------------------------------------------
 # Login helper (same as before)
@@ -86,12 +124,45 @@ def login_gamechanger(driver):
     input("Press ENTER once you’ve clicked “Log In” in Chrome…")
 
 
-def scroll_to_bottom(driver, pause=1.0, max_loops=20):
+def scroll_to_bottom(driver, settle_ms=400, max_loops=20):
+    """
+    Scroll until the page stops growing, waiting on a ResizeObserver signal
+    instead of a fixed sleep per loop.
+
+    A body-level ResizeObserver sets window.__scrollDone once the height has
+    been stable for settle_ms; each loop scrolls, waits for that flag, and
+    stops when no new content arrived. Lazy loads that land in ~100ms now
+    cost ~100ms instead of a full 1s sleep.
+    """
+    driver.execute_script(
+        "window.__scrollDone = false;"
+        "if (!window.__scrollObserver) {"
+        "  window.__scrollObserver = new ResizeObserver(() => {"
+        "    clearTimeout(window.__scrollTimer);"
+        "    window.__scrollTimer = setTimeout("
+        f"      () => window.__scrollDone = true, {settle_ms});"
+        "  });"
+        "  window.__scrollObserver.observe(document.body);"
+        "}"
+    )
+
     last_height = driver.execute_script("return document.body.scrollHeight")
     loops = 0
     while loops < max_loops:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(pause)
+        driver.execute_script(
+            "window.__scrollDone = false;"
+            "window.scrollTo(0, document.body.scrollHeight);"
+            # Arm the settle timer even if nothing resizes after this scroll
+            "clearTimeout(window.__scrollTimer);"
+            f"window.__scrollTimer = setTimeout(() => window.__scrollDone = true, {settle_ms});"
+        )
+        try:
+            WebDriverWait(driver, 20).until(
+                lambda d: d.execute_script("return window.__scrollDone")
+            )
+        except Exception:
+            print("[WARN] Timed out waiting for page height to settle.")
+
         new_height = driver.execute_script("return document.body.scrollHeight")
         if new_height == last_height:
             break
@@ -100,10 +171,57 @@ def scroll_to_bottom(driver, pause=1.0, max_loops=20):
     print(f"[INFO] Scrolling complete after {loops} loops.")
 
 
+# ---------------------------------------------------------------------
+# Async box-score fetching
+#
+# Selenium is only needed for the login/2FA dance and the schedule SPA.
+# The box-score pages themselves are fetchable over plain HTTP once we
+# have the session cookies, so we copy driver.get_cookies() into an
+# httpx.AsyncClient and fetch every box score concurrently instead of
+# driver.get-ing them one at a time with sleeps in between.
+# ---------------------------------------------------------------------
+
+MAX_CONCURRENT_FETCHES = 8
+
+
+def cookies_from_driver(driver) -> dict:
+    """Copy the logged-in Selenium session's cookies into a plain dict."""
+    return {c["name"]: c["value"] for c in driver.get_cookies()}
+
+
+async def fetch_box_score_htmls(urls, cookies) -> dict:
+    """
+    Fetch all box-score URLs concurrently (bounded by a semaphore) and
+    return {url: html or None}.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async with httpx.AsyncClient(
+        cookies=cookies,
+        timeout=30.0,
+        follow_redirects=True,
+    ) as client:
+
+        async def fetch_one(url):
+            async with sem:
+                try:
+                    resp = await client.get(url)
+                    resp.raise_for_status()
+                    return url, resp.text
+                except httpx.HTTPError as e:
+                    print(f"[WARN] Failed to fetch {url}: {e}")
+                    return url, None
+
+        results = await asyncio.gather(*[fetch_one(u) for u in urls])
+
+    return dict(results)
+
+
 # ---------------------------------------------------------------------
 # MAIN
 # ---------------------------------------------------------------------
-def main():
+def start_driver():
+    """Start the logged-in Chrome session (only when snapshots don't cover us)."""
     options = webdriver.ChromeOptions()
     user_data_dir = os.path.abspath(CHROME_USER_DATA_DIR)
     options.add_argument(f"--user-data-dir={user_data_dir}")
@@ -117,20 +235,32 @@ def main():
     driver = webdriver.Chrome(service=service, options=options)
     driver.implicitly_wait(IMPLICIT_WAIT)
 
-    try:
-        login_gamechanger(driver)
-        print("[INFO] Waiting 5s for post-login…")
-        time.sleep(5)
+    login_gamechanger(driver)
+    print("[INFO] Waiting 5s for post-login…")
+    time.sleep(5)
+    return driver
+
 
-        # 1) Load schedule and parse games (same as before)
-        print(f"\n[INFO] Loading schedule: {TEAM_SCHEDULE_URL}")
-        driver.get(TEAM_SCHEDULE_URL)
-        time.sleep(3)
-        scroll_to_bottom(driver, pause=1.0, max_loops=20)
-        time.sleep(2)
+def main():
+    driver = None
 
+    try:
+        # 1) Load schedule and parse games, from snapshot when possible
         page_team_id = TEAM_SCHEDULE_URL.strip("/").split("/")[-2]
-        html = driver.page_source
+
+        html = cached_html(TEAM_SCHEDULE_URL)
+        if html is None:
+            driver = start_driver()
+            print(f"\n[INFO] Loading schedule: {TEAM_SCHEDULE_URL}")
+            driver.get(TEAM_SCHEDULE_URL)
+            time.sleep(3)
+            scroll_to_bottom(driver, settle_ms=1000, max_loops=20)
+            time.sleep(2)
+            html = driver.page_source
+            store_html(TEAM_SCHEDULE_URL, html)
+        else:
+            print(f"\n[INFO] Using cached schedule snapshot for {TEAM_SCHEDULE_URL}")
+
         games = parse_schedule_page(html, page_team_id)
 
         print(f"[INFO] Parsed {len(games)} games for team {page_team_id}")
@@ -138,35 +268,48 @@ def main():
             print("[ERROR] No games parsed, aborting.")
             return
 
-        # 2) Pick the first game and open its BOX SCORE tab
+        # 2) Fetch ALL box scores concurrently over HTTP using the
+        #    logged-in session's cookies; Selenium's job is done once the
+        #    schedule page is parsed.
+        box_urls = []
+        for game in games:
+            u = game["box_score_url"]
+            if not u.endswith("/box-score"):
+                u = u.rstrip("/") + "/box-score"
+            box_urls.append(u)
+
+        htmls = {u: cached_html(u) for u in box_urls}
+        missing = [u for u, h in htmls.items() if h is None]
+
+        if missing:
+            if driver is None:
+                driver = start_driver()
+            cookies = cookies_from_driver(driver)
+            print(f"\n[INFO] Fetching {len(missing)} box scores concurrently...")
+            t0 = time.time()
+            fetched = asyncio.run(fetch_box_score_htmls(missing, cookies))
+            print(f"[INFO] Fetched in {time.time() - t0:.1f}s")
+            for u, h in fetched.items():
+                store_html(u, h)
+            htmls.update(fetched)
+        else:
+            print(f"\n[INFO] All {len(box_urls)} box scores served from cache.")
+
+        # 3) Parse the first game in detail (same summary as before)
         g = games[0]
         print("\n[INFO] Testing box score for first game:")
         print(
             f"  Date={g['game_date']} HA={g['home_or_away']} "
             f"Score={g['our_score']}-{g['opp_score']}"
         )
+        print(f"  URL={box_urls[0]}")
 
-        # Make sure we go directly to the BOX SCORE tab
-        box_url = g["box_score_url"]
-        if not box_url.endswith("/box-score"):
-            box_url = box_url.rstrip("/") + "/box-score"
-
-        print(f"  URL={box_url}")
-
-        driver.get(box_url)
-
-        # Wait until AG-Grid rows are actually present
-        try:
-            WebDriverWait(driver, 15).until(
-                lambda d: d.find_elements(By.CSS_SELECTOR, "div[role='row'][row-index]")
-            )
-        except Exception:
-            print("[WARN] Timed out waiting for AG-Grid rows on box score page.")
-
-        time.sleep(1)  # small extra cushion
-        box_html = driver.page_source
+        box_html = htmls.get(box_urls[0])
+        if not box_html:
+            print("[ERROR] First box score failed to download, aborting.")
+            return
 
-        # 3) Fake team IDs (just for testing parse_box_score)
+        # 4) Fake team IDs (just for testing parse_box_score)
         if g["home_or_away"] == "HOME":
             home_id = page_team_id
             away_id = "OPP"
@@ -180,7 +323,7 @@ def main():
             box_html, home_id, away_id, game_id
         )
 
-        # 4) Print summary
+        # 5) Print summary
         print("\n[RESULTS] Box score parse summary:")
         print(f"  Away batting rows:    {len(away_bat)}")
         print(f"  Home batting rows:    {len(home_bat)}")
@@ -203,7 +346,8 @@ def main():
             print(away_pitch[0])
 
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+# Production entry point:
+#
+#   gunicorn -c gunicorn.conf.py server:app
+#
+# Every endpoint is blocking filesystem I/O, so gthread workers are the
+# right class: threads hide disk/sendfile latency without async rewrites.
+# preload_app imports the app once in the master so workers share the
+# code (and the warmed season-index cache structure) copy-on-write.
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "gthread"
+threads = 8
+preload_app = True
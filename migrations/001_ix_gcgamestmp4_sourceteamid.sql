@@ -0,0 +1,26 @@
+-- 001_ix_gcgamestmp4_sourceteamid.sql
+--
+-- Covering index for the tournament aggregation queries
+-- (build_tournament_csv.py / gc_api_server.py), which filter GCGamesTmp4 by
+-- SourceTeamID and read only the score/team columns. Without this index
+-- every per-team aggregate is a full table scan; with it the GROUP BY plan
+-- becomes an index seek + stream aggregate.
+--
+-- Run once against the scrape database:
+--   sqlcmd -S <server> -d <database> -i migrations\001_ix_gcgamestmp4_sourceteamid.sql
+--
+-- After creating the index, run the aggregated tournament query once with
+-- OPTION (RECOMPILE) appended so SQL Server discards the cached scan plan
+-- and picks up the seek. Subsequent runs can omit the hint.
+
+IF NOT EXISTS (
+    SELECT 1
+      FROM sys.indexes
+     WHERE name = 'IX_GCGamesTmp4_Src_Incl'
+       AND object_id = OBJECT_ID('dbo.GCGamesTmp4')
+)
+BEGIN
+    CREATE INDEX IX_GCGamesTmp4_Src_Incl
+        ON dbo.GCGamesTmp4 (SourceTeamID)
+        INCLUDE (HomeTeamID, AwayTeamID, HomeScore, AwayScore, GameDate);
+END
@@ -1,3 +1,6 @@
+import asyncio
+import functools
+import logging
 import os
 import sys
 import time
@@ -5,15 +8,40 @@ import traceback
 import re
 import pyodbc
 import difflib
-from bs4 import BeautifulSoup
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # Optional: run the box-score GETs on one event loop instead of
+    # FETCH_WORKERS threads – hundreds of concurrent small requests with
+    # no per-request thread or context-switch cost.
+    import aiohttp
+except ImportError:
+    aiohttp = None
+from selectolax.parser import HTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    # Selenium 4.27+ — lets the chromedriver HTTP client share one larger
+    # urllib3 pool across commands instead of reconnecting per call.
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:
+    ClientConfig = None
 from dotenv import load_dotenv
-from datetime import datetime
+
+try:
+    # Optional fast path: SqlBulkCopy over Arrow IPC beats ODBC parameter
+    # binding by a wide margin for the big stats loads.
+    import pandas as pd
+    from arrowsqlbcpy import bulkcopy_from_pandas
+except ImportError:
+    pd = None
+    bulkcopy_from_pandas = None
 
 # -------------------------------------------------------------------------
 # 1) CONFIGURATION – update these before running
@@ -47,6 +75,24 @@ CHROME_PROFILE_DIR   = os.getenv('CHROME_PROFILE_DIR', 'Default')
 
 IMPLICIT_WAIT = 15  # seconds
 
+# Workers for the parallel box-score downloads (plain HTTP, I/O-bound)
+FETCH_WORKERS = 16
+
+# Concurrent connection cap for the aiohttp fetch path
+AIOHTTP_CONNECTION_LIMIT = 32
+
+# Per-span parser diagnostics go through logging.debug – no-ops (no string
+# formatting, no stdout lock) unless the level is dropped to DEBUG.
+logger = logging.getLogger(__name__)
+
+# Browser-looking UA for the direct HTTP box-score fetches
+REQUEST_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+}
+
 # List of the eight team schedule URLs
 TEAM_SCHEDULE_URLS = [
    
@@ -59,18 +105,35 @@ TEAM_SCHEDULE_URLS = [
 #    • GCGamesTmp4 now has SourceTeamID
 #    • GCBattingStatsTmp4 and GCPitchingStatsTmp4 now have TeamMatch (Yes/No)
 # -------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def get_db_connection():
+    """
+    The process-wide pyodbc connection. lru_cache means every caller shares
+    one TDS handshake per run, and a reconnect-on-failure wrapper only has
+    to cache_clear() and call again.
+
+    autocommit off: the scraper batches all inserts into one transaction
+    at the end of the run instead of paying a log flush per statement.
+    """
+    return pyodbc.connect(DB_CONNECTION_STRING, autocommit=False)
+
+
 def initialize_database():
-    conn = pyodbc.connect(DB_CONNECTION_STRING)
+    conn = get_db_connection()
     cursor = conn.cursor()
 
-    # Create Games table (added SourceTeamID)
+    # One metadata round trip for all three tables; after the first run the
+    # schema exists and we skip the CREATE TABLE statements entirely.
     cursor.execute("""
-    IF NOT EXISTS (
-        SELECT 1
+        SELECT TABLE_NAME
           FROM INFORMATION_SCHEMA.TABLES
-         WHERE TABLE_NAME = 'GCGamesTmp4'
-    )
-    BEGIN
+         WHERE TABLE_NAME IN ('GCGamesTmp4', 'GCBattingStatsTmp4', 'GCPitchingStatsTmp4')
+    """)
+    existing = {row.TABLE_NAME for row in cursor.fetchall()}
+
+    # Create Games table (added SourceTeamID)
+    if 'GCGamesTmp4' not in existing:
+        cursor.execute("""
         CREATE TABLE GCGamesTmp4 (
             GameID          VARCHAR(100) PRIMARY KEY,
             SourceTeamID    VARCHAR(50),
@@ -81,17 +144,11 @@ def initialize_database():
             AwayScore       INT,
             BoxScoreURL     VARCHAR(500)
         );
-    END
-    """)
+        """)
 
     # Create BattingStats table (added TeamMatch VARCHAR(3))
-    cursor.execute("""
-    IF NOT EXISTS (
-        SELECT 1
-          FROM INFORMATION_SCHEMA.TABLES
-         WHERE TABLE_NAME = 'GCBattingStatsTmp4'
-    )
-    BEGIN
+    if 'GCBattingStatsTmp4' not in existing:
+        cursor.execute("""
         CREATE TABLE GCBattingStatsTmp4 (
             BattingStatsID  INT IDENTITY(1,1) PRIMARY KEY,
             GameID          VARCHAR(100)   NOT NULL,
@@ -115,17 +172,11 @@ def initialize_database():
             TotalBases      INT,
             FOREIGN KEY (GameID)   REFERENCES GCGamesTmp4(GameID)
         );
-    END
-    """)
+        """)
 
     # Create PitchingStats table (added TeamMatch VARCHAR(3))
-    cursor.execute("""
-    IF NOT EXISTS (
-        SELECT 1
-          FROM INFORMATION_SCHEMA.TABLES
-         WHERE TABLE_NAME = 'GCPitchingStatsTmp4'
-    )
-    BEGIN
+    if 'GCPitchingStatsTmp4' not in existing:
+        cursor.execute("""
         CREATE TABLE GCPitchingStatsTmp4 (
             PitchingStatsID INT IDENTITY(1,1) PRIMARY KEY,
             GameID          VARCHAR(100)   NOT NULL,
@@ -146,8 +197,7 @@ def initialize_database():
             BattersFaced    INT,
             FOREIGN KEY (GameID)   REFERENCES GCGamesTmp4(GameID)
         );
-    END
-    """)
+        """)
 
     conn.commit()
     cursor.close()
@@ -208,9 +258,125 @@ def login_gamechanger(driver):
     input("Press ENTER once you’ve clicked “Log In” in Chrome…")
     return
 
+
+def build_http_session(driver) -> requests.Session:
+    """
+    Copy the logged-in Selenium session's cookies into a requests.Session so
+    box-score pages can be fetched over plain HTTP (~100ms) instead of a
+    full Chromium navigation + 2s sleep (~3s) per game.
+    """
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    for c in driver.get_cookies():
+        session.cookies.set(c['name'], c['value'], domain=c.get('domain'))
+    return session
+
+
+async def _fetch_box_scores_async(fetch_jobs, cookies):
+    """
+    GET every queued box score concurrently on a single event loop,
+    returning the same (job, html-or-None) pairs as the threaded path.
+    """
+    connector = aiohttp.TCPConnector(limit=AIOHTTP_CONNECTION_LIMIT)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers=REQUEST_HEADERS,
+        cookies=cookies,
+    ) as session:
+
+        async def fetch_one(job):
+            job_game_id, url, _home, _away = job
+            try:
+                async with session.get(url) as resp:
+                    resp.raise_for_status()
+                    return job, await resp.text()
+            except Exception as e:
+                print(f"[WARN] Failed to fetch box score for {job_game_id}: {e}")
+                return job, None
+
+        return await asyncio.gather(*[fetch_one(j) for j in fetch_jobs])
+
 # -------------------------------------------------------------------------
 # 4) parse_schedule_page using HTML Schedule structure
 # -------------------------------------------------------------------------
+# Month-header lookup for parse_schedule_page – "February 2026".split()
+# plus a dict hit beats a locale-aware strptime per header.
+MONTH_MAP = {
+    "January": 1, "February": 2, "March": 3, "April": 4,
+    "May": 5, "June": 6, "July": 7, "August": 8,
+    "September": 9, "October": 10, "November": 11, "December": 12,
+}
+
+
+def _build_name_index(names):
+    """
+    Map normalized (lowercased, stripped) full names — and, where
+    unambiguous, bare last names — back to the canonical roster spelling,
+    so extra-stat name lookups are O(1) instead of a difflib scan.
+    """
+    index = {n.lower().strip(): n for n in names}
+    by_last = {}
+    for n in names:
+        parts = n.strip().split()
+        if parts:
+            by_last.setdefault(parts[-1].lower(), []).append(n)
+    for last, matches in by_last.items():
+        if last not in index and len(matches) == 1:
+            index[last] = matches[0]
+    return index
+
+
+def _match_player_name(raw_name, names, name_index):
+    """Resolve an extra-stats name; fuzzy difflib only as a last resort."""
+    match = name_index.get(raw_name.lower().strip())
+    if match is not None:
+        return match
+    close = difflib.get_close_matches(raw_name, names, n=1, cutoff=0.6)
+    return close[0] if close else None
+
+
+# parse_box_score emits rows as lists in the exact INSERT column order of
+# section 6 (BATTING_COLUMNS / PITCHING_COLUMNS) rather than dicts – no
+# per-row dict allocation, and main() can hand them straight to
+# executemany. TeamMatch (index 4) is filled in by the caller, who knows
+# which team the schedule page belongs to. Named offsets for the fields
+# the extras pass touches:
+_ROW_TEAM_ID = 1
+_ROW_TEAM_MATCH = 4
+_BAT_PLAYER = 6
+_BAT_2B, _BAT_3B, _BAT_HR = 14, 15, 16
+_PITCH_NAME = 6
+_PITCH_PITCHES, _PITCH_STRIKES, _PITCH_BF = 13, 14, 15
+
+# Compiled once at import; parse_box_score runs these against every
+# extra-stat span of every game, so skip re's per-call cache lookup.
+_PITCHES_RE = re.compile(r"(\d+)-(\d+)")
+_BATTING_EXTRA_RE = re.compile(r"(.+?)(?:\s+(\d+))?$")
+_PITCH_EXTRA_RE = re.compile(r"(.+?)\s+([0-9\-]+)$")
+
+
+def _next_sibling_div(node, *class_tokens, class_substring=None):
+    """
+    selectolax has no find_next_sibling(); walk .next past text nodes until
+    we hit a div carrying every class in class_tokens (and, optionally,
+    class_substring somewhere in its class attribute).
+    """
+    sib = node.next
+    while sib is not None:
+        if sib.tag == 'div':
+            class_attr = sib.attributes.get('class') or ''
+            classes = class_attr.split()
+            if all(t in classes for t in class_tokens) and (
+                class_substring is None or class_substring in class_attr
+            ):
+                return sib
+        sib = sib.next
+    return None
+
+
+
 def parse_schedule_page(html: str, team_id: str) -> list[dict]:
     """
     Parses a GameChanger “/schedule” page HTML.
@@ -220,58 +386,56 @@ def parse_schedule_page(html: str, team_id: str) -> list[dict]:
       - home_or_away
       - our_score, opp_score
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = HTMLParser(html)
     results = []
 
-    for header_div in soup.select("div.ScheduleSection__stickyItem"):
-        month_span = header_div.select_one("span.ScheduleSection__sectionTitle")
+    for header_div in tree.css("div.ScheduleSection__stickyItem"):
+        month_span = header_div.css_first("span.ScheduleSection__sectionTitle")
         if not month_span:
             continue
-        month_year = month_span.get_text(strip=True)
+        month_year = month_span.text(strip=True)
+        parts = month_year.split()
+        if len(parts) != 2 or parts[0] not in MONTH_MAP:
+            continue
+        month_num = MONTH_MAP[parts[0]]
         try:
-            month_dt = datetime.strptime(month_year, "%B %Y")
+            year = int(parts[1])
         except ValueError:
             continue
 
-        sibling = header_div.find_next_sibling(
-            lambda tag: tag.name == "div"
-                       and "ScheduleSection__section" in tag.get("class", [])
-                       and "ScheduleListByMonth__eventMonth" in tag.get("class", [])
+        sibling = _next_sibling_div(
+            header_div, "ScheduleSection__section", "ScheduleListByMonth__eventMonth"
         )
         if not sibling:
             continue
 
-        for day_row in sibling.select("div.ScheduleListByMonth__dayRow"):
-            date_text_div = day_row.select_one("div.ScheduleListByMonth__dateText")
+        for day_row in sibling.css("div.ScheduleListByMonth__dayRow"):
+            date_text_div = day_row.css_first("div.ScheduleListByMonth__dateText")
             if not date_text_div:
                 continue
-            day_num = date_text_div.get_text(strip=True)
+            day_num = date_text_div.text(strip=True)
             try:
                 day_num_int = int(day_num)
             except ValueError:
                 continue
 
-            full_date = datetime(
-                year=month_dt.year,
-                month=month_dt.month,
-                day=day_num_int
-            ).strftime("%Y-%m-%d")
+            full_date = f"{year:04d}-{month_num:02d}-{day_num_int:02d}"
 
-            for link in day_row.select("a.ScheduleListByMonth__event"):  # each game
-                raw_href = link.get("href")
+            for link in day_row.css("a.ScheduleListByMonth__event"):  # each game
+                raw_href = link.attributes.get("href")
                 if not raw_href:
                     continue
                 box_score_url = "https://web.gc.com" + raw_href
 
-                title_div = link.select_one("div.ScheduleListByMonth__title")
+                title_div = link.css_first("div.ScheduleListByMonth__title")
                 event_title = ""
                 if title_div:
-                    semibold = title_div.select_one("div.Text__semibold")
+                    semibold = title_div.css_first("div.Text__semibold")
                     if semibold:
-                        event_title = semibold.get_text(" ", strip=True)
+                        event_title = semibold.text(separator=" ", strip=True)
 
-                score_span = link.select_one("span.ScheduleListByMonth__scoreOrTimeText")
-                score_text = score_span.get_text(strip=True) if score_span else ""
+                score_span = link.css_first("span.ScheduleListByMonth__scoreOrTimeText")
+                score_text = score_span.text(strip=True) if score_span else ""
 
                 home_or_away = None
                 if event_title.startswith("vs."):
@@ -305,13 +469,13 @@ def parse_schedule_page(html: str, team_id: str) -> list[dict]:
 # 5) parse_box_score with robust extra-stats parsing, now including Opponent
 # -------------------------------------------------------------------------
 def parse_box_score(html, home_team_id, away_team_id, game_id):
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = HTMLParser(html)
 
     # Extract team names from the box score header
-    away_team_name_div = soup.select_one('div.BoxScore__teamName.BoxScore__awayTeamName')
-    home_team_name_div = soup.select_one('div.BoxScore__teamName.BoxScore__homeTeamName')
-    away_team_name = away_team_name_div.get_text(strip=True) if away_team_name_div else ''
-    home_team_name = home_team_name_div.get_text(strip=True) if home_team_name_div else ''
+    away_team_name_div = tree.css_first('div.BoxScore__teamName.BoxScore__awayTeamName')
+    home_team_name_div = tree.css_first('div.BoxScore__teamName.BoxScore__homeTeamName')
+    away_team_name = away_team_name_div.text(strip=True) if away_team_name_div else ''
+    home_team_name = home_team_name_div.text(strip=True) if home_team_name_div else ''
 
     def parse_int(value):
         try:
@@ -321,7 +485,7 @@ def parse_box_score(html, home_team_id, away_team_id, game_id):
 
     def parse_pitches_strikes(count_str):
         clean = count_str.strip().rstrip(',')
-        m = re.search(r"(\d+)-(\d+)", clean)
+        m = _PITCHES_RE.search(clean)
         if m:
             return int(m.group(1)), int(m.group(2))
         return None, None
@@ -331,100 +495,89 @@ def parse_box_score(html, home_team_id, away_team_id, game_id):
         batting_stats = []
         # Determine opponent name
         opponent_name = home_team_name if home_or_away_flag == 'AWAY' else away_team_name
-        for row in team_container.select(
+        for row in team_container.css(
             'div.ag-root-wrapper-body div.ag-center-cols-container div[role="row"]'
         ):
-            first_cell = row.select_one('div[aria-colindex="1"]')
-            if not first_cell:
+            # One subtree walk for all cells instead of one per column
+            cells = row.css('div[aria-colindex]')
+            if not cells:
                 continue
-            player_name_span = first_cell.select_one('span.BoxScoreComponents__playerName')
+            first_cell = cells[0]
+            player_name_span = first_cell.css_first('span.BoxScoreComponents__playerName')
             if not player_name_span:
                 continue
             try:
-                name = player_name_span.get_text(strip=True)
-                pos_info_span = first_cell.select_one('span.BoxScoreComponents__playerInfo')
-                pos = pos_info_span.get_text(strip=True).strip('()') if pos_info_span else ''
-
-                ab  = parse_int(row.select_one('div[aria-colindex="2"]').get_text(strip=True) or 0)
-                r   = parse_int(row.select_one('div[aria-colindex="3"]').get_text(strip=True) or 0)
-                h   = parse_int(row.select_one('div[aria-colindex="4"]').get_text(strip=True) or 0)
-                rbi = parse_int(row.select_one('div[aria-colindex="5"]').get_text(strip=True) or 0)
-                bb  = parse_int(row.select_one('div[aria-colindex="6"]').get_text(strip=True) or 0)
-                so  = parse_int(row.select_one('div[aria-colindex="7"]').get_text(strip=True) or 0)
-
-                batting_stats.append({
-                    'GameID':      game_id,
-                    'TeamID':      team_id,
-                    'TeamName':    team_name,
-                    'HomeOrAway':  home_or_away_flag,
-                    'Opponent':    opponent_name,
-                    'PlayerName':  name,
-                    'Position':    pos,
-                    'AB':          ab,
-                    'R':           r,
-                    'H':           h,
-                    'RBI':         rbi,
-                    'BB':          bb,
-                    'SO':          so,
-                    'Doubles':     0,
-                    'Triples':     0,
-                    'HomeRuns':    0,
-                    'StolenBases': 0,
-                    'TotalBases':  0
-                })
+                name = player_name_span.text(strip=True)
+                pos_info_span = first_cell.css_first('span.BoxScoreComponents__playerInfo')
+                pos = pos_info_span.text(strip=True).strip('()') if pos_info_span else ''
+
+                ab  = parse_int(cells[1].text(strip=True) or 0)
+                r   = parse_int(cells[2].text(strip=True) or 0)
+                h   = parse_int(cells[3].text(strip=True) or 0)
+                rbi = parse_int(cells[4].text(strip=True) or 0)
+                bb  = parse_int(cells[5].text(strip=True) or 0)
+                so  = parse_int(cells[6].text(strip=True) or 0)
+
+                # BATTING_COLUMNS order; TeamMatch stays None for main()
+                batting_stats.append([
+                    game_id,
+                    team_id[:50],
+                    team_name[:200],
+                    home_or_away_flag,
+                    None,
+                    opponent_name[:200],
+                    name[:200],
+                    pos[:20],
+                    ab, r, h, rbi, bb, so,
+                    0, 0, 0, 0, 0,
+                ])
             except Exception as e:
                 print(f"  [WARN] Error parsing batting row: {e}")
                 continue
 
         # Parse extra batting stats container
-        extra_container = team_container.find_next_sibling(
-            lambda tag: tag.name == 'div' and 'BoxScoreComponents__boxScoreExtraStats' in tag.get('class', [])
+        player_names = [bd[_BAT_PLAYER] for bd in batting_stats]
+        name_index = _build_name_index(player_names)
+
+        extra_container = _next_sibling_div(
+            team_container, 'BoxScoreComponents__boxScoreExtraStats'
         )
         if extra_container:
-            for line_div in extra_container.select('div'):
-                label_span = line_div.select_one('span.Text__semibold')
+            for line_div in extra_container.css('div'):
+                label_span = line_div.css_first('span.Text__semibold')
                 if not label_span:
                     continue
-                stat_label = label_span.get_text(strip=True).rstrip(':')
-                for stat_span in line_div.select('span.BoxScoreComponents__extraPlayerStat'):
-                    text = stat_span.get_text(strip=True).rstrip(',')
+                stat_label = label_span.text(strip=True).rstrip(':')
+                for stat_span in line_div.css('span.BoxScoreComponents__extraPlayerStat'):
+                    text = stat_span.text(strip=True).rstrip(',')
                     # Allow for optional number: if absent, default to 1
-                    parts = re.match(r"(.+?)(?:\s+(\d+))?$", text)
+                    parts = _BATTING_EXTRA_RE.match(text)
                     if not parts:
-                        print(f"  [DEBUG] Regex failed to match batting extra: '{text}'")
+                        logger.debug("Regex failed to match batting extra: '%s'", text)
                         continue
                     raw_name = parts.group(1).strip()
                     count_str = parts.group(2).strip() if parts.group(2) else '1'
 
-                    # Match player name exactly or via close match
-                    player_names = [bd['PlayerName'] for bd in batting_stats]
-                    player_match = None
-                    if raw_name in player_names:
-                        player_match = raw_name
-                    else:
-                        close = difflib.get_close_matches(raw_name, player_names, n=1, cutoff=0.6)
-                        if close:
-                            player_match = close[0]
-
+                    player_match = _match_player_name(raw_name, player_names, name_index)
                     if not player_match:
                         print(f"  [WARN] No match for extra batting name: '{raw_name}' in {player_names}")
                         continue
 
                     stat_count = parse_int(count_str)
                     for bd in batting_stats:
-                        if bd['PlayerName'] == player_match:
+                        if bd[_BAT_PLAYER] == player_match:
                             if stat_label == '2B':
-                                bd['Doubles'] = stat_count
-                                print(f"[DEBUG] Updated {player_match}: Doubles={stat_count}")
+                                bd[_BAT_2B] = stat_count
+                                logger.debug("Updated %s: Doubles=%s", player_match, stat_count)
                             elif stat_label == '3B':
-                                bd['Triples'] = stat_count
-                                print(f"[DEBUG] Updated {player_match}: Triples={stat_count}")
+                                bd[_BAT_3B] = stat_count
+                                logger.debug("Updated %s: Triples=%s", player_match, stat_count)
                             elif stat_label == 'HR':
-                                bd['HomeRuns'] = stat_count
-                                print(f"[DEBUG] Updated {player_match}: HomeRuns={stat_count}")
+                                bd[_BAT_HR] = stat_count
+                                logger.debug("Updated %s: HomeRuns=%s", player_match, stat_count)
                             break
         else:
-            print(f"[DEBUG] No extra batting stats container found")
+            logger.debug("No extra batting stats container found")
 
         return batting_stats
 
@@ -432,75 +585,67 @@ def parse_box_score(html, home_team_id, away_team_id, game_id):
         pitching_stats = []
         # Determine opponent name
         opponent_name = home_team_name if home_or_away_flag == 'AWAY' else away_team_name
-        for row in team_container.select(
+        for row in team_container.css(
             'div.ag-root-wrapper-body div.ag-center-cols-container div[role="row"]'
         ):
-            first_cell = row.select_one('div[aria-colindex="1"]')
-            if not first_cell:
+            # One subtree walk for all cells instead of one per column
+            cells = row.css('div[aria-colindex]')
+            if not cells:
                 continue
-            pitcher_name_span = first_cell.select_one('span.BoxScoreComponents__playerName')
+            first_cell = cells[0]
+            pitcher_name_span = first_cell.css_first('span.BoxScoreComponents__playerName')
             if not pitcher_name_span:
                 continue
             try:
-                pitcher_name = pitcher_name_span.get_text(strip=True)
-                ip = row.select_one('div[aria-colindex="2"]').get_text(strip=True)
-                h_allowed  = parse_int(row.select_one('div[aria-colindex="3"]').get_text(strip=True) or 0)
-                r_allowed  = parse_int(row.select_one('div[aria-colindex="4"]').get_text(strip=True) or 0)
-                er_allowed = parse_int(row.select_one('div[aria-colindex="5"]').get_text(strip=True) or 0)
-                bb_allowed = parse_int(row.select_one('div[aria-colindex="6"]').get_text(strip=True) or 0)
-                so = parse_int(row.select_one('div[aria-colindex="7"]').get_text(strip=True) or 0)
-
-                pitching_stats.append({
-                    'GameID':      game_id,
-                    'TeamID':      team_id,
-                    'TeamName':    team_name,
-                    'HomeOrAway':  home_or_away_flag,
-                    'Opponent':    opponent_name,
-                    'PitcherName': pitcher_name,
-                    'IP':          ip,
-                    'HAllowed':    h_allowed,
-                    'RAllowed':    r_allowed,
-                    'ERAllowed':   er_allowed,
-                    'BBAllowed':   bb_allowed,
-                    'Strikeouts':  so,
-                    'PitchesThrown': None,
-                    'StrikesThrown': None,
-                    'BattersFaced':  None
-                })
+                pitcher_name = pitcher_name_span.text(strip=True)
+                ip = cells[1].text(strip=True)
+                h_allowed  = parse_int(cells[2].text(strip=True) or 0)
+                r_allowed  = parse_int(cells[3].text(strip=True) or 0)
+                er_allowed = parse_int(cells[4].text(strip=True) or 0)
+                bb_allowed = parse_int(cells[5].text(strip=True) or 0)
+                so = parse_int(cells[6].text(strip=True) or 0)
+
+                # PITCHING_COLUMNS order; TeamMatch stays None for main()
+                pitching_stats.append([
+                    game_id,
+                    team_id[:50],
+                    team_name[:200],
+                    home_or_away_flag,
+                    None,
+                    opponent_name[:200],
+                    pitcher_name[:200],
+                    ip[:10],
+                    h_allowed, r_allowed, er_allowed, bb_allowed, so,
+                    None, None, None,
+                ])
             except Exception as e:
                 print(f"  [WARN] Error parsing pitcher row: {e}")
                 continue
 
-        pitcher_names = [rd['PitcherName'] for rd in pitching_stats]
+        pitcher_names = [rd[_PITCH_NAME] for rd in pitching_stats]
+        name_index = _build_name_index(pitcher_names)
 
-        extra_container = team_container.find_next_sibling(
-            lambda tag: tag.name == 'div'
-                       and 'BoxScoreComponents__boxScoreExtraStats' in tag.get('class', [])
-                       and 'PitchingExtra' in ' '.join(tag.get('class', []))
+        extra_container = _next_sibling_div(
+            team_container,
+            'BoxScoreComponents__boxScoreExtraStats',
+            class_substring='PitchingExtra',
         )
         if extra_container:
-            for line_div in extra_container.select('div'):
-                label_span = line_div.select_one('span.Text__semibold')
+            for line_div in extra_container.css('div'):
+                label_span = line_div.css_first('span.Text__semibold')
                 if not label_span:
                     continue
-                stat_label = label_span.get_text(strip=True).rstrip(':')
-                for stat_span in line_div.select('span.BoxScoreComponents__extraPlayerStat'):
-                    text = stat_span.get_text(strip=True).rstrip(',')
-                    parts = re.match(r"(.+?)\s+([0-9\-]+)$", text)
+                stat_label = label_span.text(strip=True).rstrip(':')
+                for stat_span in line_div.css('span.BoxScoreComponents__extraPlayerStat'):
+                    text = stat_span.text(strip=True).rstrip(',')
+                    parts = _PITCH_EXTRA_RE.match(text)
                     if not parts:
-                        print(f"  [DEBUG] Regex failed to match: '{text}'")
+                        logger.debug("Regex failed to match: '%s'", text)
                         continue
                     raw_name = parts.group(1).strip()
                     count_str = parts.group(2).strip()
 
-                    pitcher_name_match = None
-                    if raw_name in pitcher_names:
-                        pitcher_name_match = raw_name
-                    else:
-                        match = difflib.get_close_matches(raw_name, pitcher_names, n=1, cutoff=0.6)
-                        if match:
-                            pitcher_name_match = match[0]
-
+                    pitcher_name_match = _match_player_name(raw_name, pitcher_names, name_index)
                     if not pitcher_name_match:
                         print(f"  [WARN] No match for extra stat pitcher name: '{raw_name}' in {pitcher_names}")
                         continue
@@ -509,10 +654,10 @@ def parse_box_score(html, home_team_id, away_team_id, game_id):
                         pitches, strikes = parse_pitches_strikes(count_str)
                         if pitches is not None and strikes is not None:
                             for rd in pitching_stats:
-                                if rd['PitcherName'] == pitcher_name_match:
-                                    rd['PitchesThrown'] = pitches
-                                    rd['StrikesThrown'] = strikes
-                                    print(f"[DEBUG] Updated {pitcher_name_match}: PitchesThrown={pitches}, StrikesThrown={strikes}")
+                                if rd[_PITCH_NAME] == pitcher_name_match:
+                                    rd[_PITCH_PITCHES] = pitches
+                                    rd[_PITCH_STRIKES] = strikes
+                                    logger.debug("Updated %s: PitchesThrown=%s, StrikesThrown=%s", pitcher_name_match, pitches, strikes)
                                     break
                     elif stat_label in ('Batters Faced', 'BF'):
                         try:
@@ -521,51 +666,176 @@ def parse_box_score(html, home_team_id, away_team_id, game_id):
                             print(f"  [WARN] Failed to parse batters faced: '{count_str}'")
                             continue
                         for rd in pitching_stats:
-                            if rd['PitcherName'] == pitcher_name_match:
-                                rd['BattersFaced'] = bf_count
-                                print(f"[DEBUG] Updated {pitcher_name_match}: BattersFaced={bf_count}")
+                            if rd[_PITCH_NAME] == pitcher_name_match:
+                                rd[_PITCH_BF] = bf_count
+                                logger.debug("Updated %s: BattersFaced=%s", pitcher_name_match, bf_count)
                                 break
         else:
-            print(f"[DEBUG] No extra stats container found")
+            logger.debug("No extra stats container found")
 
         for rd in pitching_stats:
-            if rd['PitchesThrown'] is None or rd['StrikesThrown'] is None:
-                print(f"[WARN] Pitcher {rd['PitcherName']} missing pitch data: Pitches={rd['PitchesThrown']}, Strikes={rd['StrikesThrown']}")
+            if rd[_PITCH_PITCHES] is None or rd[_PITCH_STRIKES] is None:
+                print(f"[WARN] Pitcher {rd[_PITCH_NAME]} missing pitch data: Pitches={rd[_PITCH_PITCHES]}, Strikes={rd[_PITCH_STRIKES]}")
 
         return pitching_stats
 
-    away_batting_container = soup.select_one('div.BoxScore__awayLineup')
+    away_batting_container = tree.css_first('div.BoxScore__awayLineup')
     away_batting = extract_batting(away_batting_container, away_team_id, away_team_name, 'AWAY') if away_batting_container else []
-    home_batting_container = soup.select_one('div.BoxScore__homeLineup')
+    home_batting_container = tree.css_first('div.BoxScore__homeLineup')
     home_batting = extract_batting(home_batting_container, home_team_id, home_team_name, 'HOME') if home_batting_container else []
 
-    away_pitch_container = soup.select_one('div.BoxScore__awayPitching')
+    away_pitch_container = tree.css_first('div.BoxScore__awayPitching')
     away_pitching = extract_pitching(away_pitch_container, away_team_id, away_team_name, 'AWAY') if away_pitch_container else []
-    home_pitch_container = soup.select_one('div.BoxScore__homePitching')
+    home_pitch_container = tree.css_first('div.BoxScore__homePitching')
     home_pitching = extract_pitching(home_pitch_container, home_team_id, home_team_name, 'HOME') if home_pitch_container else []
 
     return away_batting, home_batting, away_pitching, home_pitching
 
 # -------------------------------------------------------------------------
 # 6) MAIN SCRAPER
+#    Rows are accumulated in Python while scraping and flushed to SQL Server
+#    in large executemany batches at the end – one round trip and one log
+#    flush per chunk instead of per row.
 # -------------------------------------------------------------------------
+
+INSERT_CHUNK_SIZE = 1000
+
+GAME_INSERT_SQL = """
+    SET NOCOUNT ON;
+    INSERT INTO GCGamesTmp4 WITH (TABLOCK)
+      (GameID, SourceTeamID, GameDate, HomeTeamID, AwayTeamID, HomeScore, AwayScore, BoxScoreURL)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+BATTING_INSERT_SQL = """
+    SET NOCOUNT ON;
+    INSERT INTO GCBattingStatsTmp4 WITH (TABLOCK)
+      (GameID, TeamID, TeamName, HomeOrAway, TeamMatch, Opponent, PlayerName, Position,
+       AB, R, H, RBI, BB, SO, Doubles, Triples, HomeRuns, StolenBases, TotalBases)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+PITCHING_INSERT_SQL = """
+    SET NOCOUNT ON;
+    INSERT INTO GCPitchingStatsTmp4 WITH (TABLOCK)
+      (GameID, TeamID, TeamName, HomeOrAway, TeamMatch, Opponent, PitcherName,
+       IP, HAllowed, RAllowed, ERAllowed, BBAllowed, Strikeouts,
+       PitchesThrown, StrikesThrown, BattersFaced)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Column order matches the INSERT statements / accumulated row tuples above.
+BATTING_COLUMNS = (
+    'GameID', 'TeamID', 'TeamName', 'HomeOrAway', 'TeamMatch', 'Opponent',
+    'PlayerName', 'Position', 'AB', 'R', 'H', 'RBI', 'BB', 'SO',
+    'Doubles', 'Triples', 'HomeRuns', 'StolenBases', 'TotalBases',
+)
+PITCHING_COLUMNS = (
+    'GameID', 'TeamID', 'TeamName', 'HomeOrAway', 'TeamMatch', 'Opponent',
+    'PitcherName', 'IP', 'HAllowed', 'RAllowed', 'ERAllowed', 'BBAllowed',
+    'Strikeouts', 'PitchesThrown', 'StrikesThrown', 'BattersFaced',
+)
+
+
+# Explicit parameter sizes (matching the DDL in initialize_database) so
+# fast_executemany binds column-wise arrays directly instead of scanning
+# every batch to re-measure string lengths.
+_VC = pyodbc.SQL_VARCHAR
+_INT = (pyodbc.SQL_INTEGER, 0, 0)
+
+GAME_INPUTSIZES = [
+    (_VC, 100, 0), (_VC, 50, 0), (_VC, 10, 0), (_VC, 50, 0), (_VC, 50, 0),
+    _INT, _INT, (_VC, 500, 0),
+]
+BATTING_INPUTSIZES = [
+    (_VC, 100, 0), (_VC, 50, 0), (_VC, 200, 0), (_VC, 10, 0), (_VC, 3, 0),
+    (_VC, 200, 0), (_VC, 200, 0), (_VC, 20, 0),
+] + [_INT] * 11
+PITCHING_INPUTSIZES = [
+    (_VC, 100, 0), (_VC, 50, 0), (_VC, 200, 0), (_VC, 10, 0), (_VC, 3, 0),
+    (_VC, 200, 0), (_VC, 200, 0), (_VC, 10, 0),
+] + [_INT] * 8
+
+
+def flush_batch(cursor, sql, rows, label, inputsizes=None):
+    """executemany the accumulated rows in chunks; the caller owns the
+    transaction and commits (or rolls back) once all tables are flushed."""
+    if not rows:
+        return
+    if inputsizes:
+        cursor.setinputsizes(inputsizes)
+    for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[i:i + INSERT_CHUNK_SIZE]
+        cursor.executemany(sql, chunk)
+    print(f"[INSERT] {len(rows)} {label} rows flushed in batches.")
+
+
+def bulk_load_stats(cursor, table, columns, rows, fallback_sql, label):
+    """
+    Load stats rows via SqlBulkCopy (arrowsqlbcpy) when available – the TDS
+    bulk-insert protocol skips per-parameter ODBC marshalling entirely.
+    Falls back to the batched executemany path otherwise.
+    """
+    if not rows:
+        return
+    if bulkcopy_from_pandas is None:
+        inputsizes = (BATTING_INPUTSIZES if columns is BATTING_COLUMNS
+                      else PITCHING_INPUTSIZES)
+        flush_batch(cursor, fallback_sql, rows, label, inputsizes)
+        return
+
+    df = pd.DataFrame(rows, columns=list(columns))
+    bulkcopy_from_pandas(df, DB_CONNECTION_STRING, table)
+    print(f"[INSERT] {len(rows)} {label} rows bulk-copied into {table}.")
+
+
 def main():
+    logging.basicConfig(level=logging.INFO)
+
     conn = initialize_database()
     cursor = conn.cursor()
+    cursor.fast_executemany = True
 
     options = webdriver.ChromeOptions()
     user_data_dir = os.path.abspath(CHROME_USER_DATA_DIR)
     options.add_argument(f"--user-data-dir={user_data_dir}")
     options.add_argument(f"--profile-directory={CHROME_PROFILE_DIR}")
+    # We only consume page_source, so DOMContentLoaded is enough – don't
+    # wait for images/analytics, and don't fetch images at all.
+    options.page_load_strategy = 'eager'
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    # Headless by default; set GC_HEADLESS=0 for the first run on a fresh
+    # profile, which needs the window for the manual 2FA step.
+    if os.getenv('GC_HEADLESS', '1').strip() != '0':
+        options.add_argument('--headless=new')
     options.add_argument('--disable-gpu')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--remote-debugging-port=9222')
     options.add_argument('--window-size=1920,1080')
+    # Drop chromedriver's per-command console logging – it adds latency to
+    # every driver.get/find_element round trip.
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
 
     service = ChromeService(ChromeDriverManager().install())
     service.log_level = 'WARN'
+
+    driver_kwargs = {}
+    if ClientConfig is not None:
+        driver_kwargs['client_config'] = ClientConfig(
+            remote_server_addr=service.service_url,
+            init_args_for_pool_manager={"maxsize": 20, "block": False},
+        )
+
     try:
-        driver = webdriver.Chrome(service=service, options=options)
+        try:
+            driver = webdriver.Chrome(service=service, options=options, **driver_kwargs)
+        except TypeError:
+            # Installed selenium predates client_config on local drivers
+            driver = webdriver.Chrome(service=service, options=options)
     except Exception as e:
         print(f"[FATAL] Could not start Chrome driver: {e}")
         sys.exit(1)
@@ -577,15 +847,43 @@ def main():
         print("[INFO] Waiting 5s for post-login…")
         time.sleep(5)
 
+        # Selenium got us past login/2FA; box scores come over plain HTTP.
+        session = build_http_session(driver)
+
+        # Accumulators for the batched inserts; seen_game_ids pre-deduplicates
+        # on game_id so the batch never trips the GCGamesTmp4 primary key.
+        # Seeding it with every GameID already in the table means incremental
+        # re-runs skip the insert AND the box-score download for games loaded
+        # by a previous run.
+        game_rows = []
+        batting_rows = []
+        pitching_rows = []
+        cursor.execute("SELECT GameID FROM GCGamesTmp4")
+        seen_game_ids = {r[0] for r in cursor.fetchall()}
+        if seen_game_ids:
+            print(f"[INFO] {len(seen_game_ids)} games already ingested; will skip them.")
+
         for schedule_url in TEAM_SCHEDULE_URLS:
             driver.get(schedule_url)
-            time.sleep(2)
+            try:
+                # Return as soon as the schedule rows exist instead of a
+                # flat 2s sleep per team page.
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "div.ScheduleListByMonth__dayRow")
+                    )
+                )
+            except Exception:
+                print(f"[WARN] Schedule rows never appeared for {schedule_url}")
 
             page_team_id = schedule_url.strip('/').split('/')[-2]
             html = driver.page_source
             games = parse_schedule_page(html, page_team_id)
             print(f"[INFO] Found {len(games)} games for team {page_team_id}")
 
+            # First pass: queue game rows and collect fetch jobs
+            fetch_jobs = []  # (game_id, box_score_url, home_id, away_id)
+
             for g in games:
                 if not g['box_score_url']:
                     continue
@@ -605,133 +903,88 @@ def main():
                 date_part = g['game_date']
                 game_id = f"{date_part}_{home_id}_vs_{away_id}"
 
-                # ------------------------
-                # Insert into GCGamesTmp4 (now with SourceTeamID)
-                # ------------------------
-                try:
-                    cursor.execute("""
-                        INSERT INTO GCGamesTmp4
-                          (GameID, SourceTeamID, GameDate, HomeTeamID, AwayTeamID, HomeScore, AwayScore, BoxScoreURL)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        game_id,
-                        page_team_id,
-                        g['game_date'],
-                        home_id,
-                        away_id,
-                        our_score if ha == 'HOME' else opp_score,
-                        opp_score if ha == 'HOME' else our_score,
-                        g['box_score_url']
-                    )
-                    conn.commit()
-                    print(f"[INSERT] Games: {game_id}")
-                except pyodbc.IntegrityError:
-                    pass
-
-                # ------------------------
-                # Fetch and parse the box score
-                # ------------------------
-                try:
-                    driver.get(g['box_score_url'])
-                    time.sleep(2)
-                    box_html = driver.page_source
+                if game_id in seen_game_ids:
+                    continue
+                seen_game_ids.add(game_id)
+
+                game_rows.append((
+                    game_id,
+                    page_team_id,
+                    g['game_date'],
+                    home_id,
+                    away_id,
+                    our_score if ha == 'HOME' else opp_score,
+                    opp_score if ha == 'HOME' else our_score,
+                    g['box_score_url']
+                ))
+                print(f"[QUEUE] Games: {game_id}")
+                fetch_jobs.append((game_id, g['box_score_url'], home_id, away_id))
+
+            # ------------------------
+            # Fetch all box scores in parallel (independent I/O-bound GETs),
+            # then parse on the main thread. With aiohttp installed the GETs
+            # share a single event loop; otherwise fall back to the thread
+            # pool over the requests session.
+            # ------------------------
+            if aiohttp is not None:
+                cookies = {c['name']: c['value'] for c in driver.get_cookies()}
+                fetched = asyncio.run(_fetch_box_scores_async(fetch_jobs, cookies))
+            else:
+                def fetch_one(job):
+                    job_game_id, url, _home, _away = job
+                    try:
+                        resp = session.get(url, timeout=30)
+                        resp.raise_for_status()
+                        return job, resp.text
+                    except Exception as e:
+                        print(f"[WARN] Failed to fetch box score for {job_game_id}: {e}")
+                        return job, None
+
+                with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+                    fetched = list(ex.map(fetch_one, fetch_jobs))
+
+            for (game_id, box_url, home_id, away_id), box_html in fetched:
+                if box_html is None:
+                    continue
 
+                try:
                     away_bat, home_bat, away_pitch, home_pitch = parse_box_score(
                         box_html, home_id, away_id, game_id
                     )
 
-                    # ------------------------
-                    # Insert batting stats (with TeamMatch)
-                    # ------------------------
+                    # Rows arrive already in INSERT column order; just fill
+                    # TeamMatch ('Yes' if the row's TeamID == page_team_id)
+                    # and freeze to tuples for executemany.
                     for row in away_bat + home_bat:
-                        try:
-                            team_name   = row['TeamName'][:200]
-                            opponent    = row['Opponent'][:200]
-                            player_name = row['PlayerName'][:200]
-                            position    = row['Position'][:20]
-                            # TeamMatch = 'Yes' if this row’s TeamID == page_team_id, else 'No'
-                            team_match = 'Yes' if row['TeamID'] == page_team_id else 'No'
-
-                            cursor.execute("""
-                                INSERT INTO GCBattingStatsTmp4
-                                  (GameID, TeamID, TeamName, HomeOrAway, TeamMatch, Opponent, PlayerName, Position,
-                                   AB, R, H, RBI, BB, SO, Doubles, Triples, HomeRuns, StolenBases, TotalBases)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                                row['GameID'],
-                                row['TeamID'][:50],
-                                team_name,
-                                row['HomeOrAway'],
-                                team_match,
-                                opponent,
-                                player_name,
-                                position,
-                                row['AB'],
-                                row['R'],
-                                row['H'],
-                                row['RBI'],
-                                row['BB'],
-                                row['SO'],
-                                row['Doubles'],
-                                row['Triples'],
-                                row['HomeRuns'],
-                                row['StolenBases'],
-                                row['TotalBases']
-                            )
-                        except pyodbc.IntegrityError:
-                            continue
-                        except Exception as e:
-                            print(f"  [WARN] Batting insert failed: {e}")
-                            continue
+                        row[_ROW_TEAM_MATCH] = 'Yes' if row[_ROW_TEAM_ID] == page_team_id else 'No'
+                        batting_rows.append(tuple(row))
 
-                    # ------------------------
-                    # Insert pitching stats (with TeamMatch)
-                    # ------------------------
                     for row in away_pitch + home_pitch:
-                        try:
-                            team_name    = row['TeamName'][:200]
-                            opponent     = row['Opponent'][:200]
-                            pitcher_name = row['PitcherName'][:200]
-                            team_match   = 'Yes' if row['TeamID'] == page_team_id else 'No'
-
-                            cursor.execute("""
-                                INSERT INTO GCPitchingStatsTmp4
-                                  (GameID, TeamID, TeamName, HomeOrAway, TeamMatch, Opponent, PitcherName,
-                                   IP, HAllowed, RAllowed, ERAllowed, BBAllowed, Strikeouts,
-                                   PitchesThrown, StrikesThrown, BattersFaced)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                                row['GameID'],
-                                row['TeamID'][:50],
-                                team_name,
-                                row['HomeOrAway'],
-                                team_match,
-                                opponent,
-                                pitcher_name,
-                                row['IP'][:10],
-                                row['HAllowed'],
-                                row['RAllowed'],
-                                row['ERAllowed'],
-                                row['BBAllowed'],
-                                row['Strikeouts'],
-                                row['PitchesThrown'],
-                                row['StrikesThrown'],
-                                row['BattersFaced']
-                            )
-                        except pyodbc.IntegrityError:
-                            continue
-                        except Exception as e:
-                            print(f"  [WARN] Pitching insert failed: {e}")
-                            continue
+                        row[_ROW_TEAM_MATCH] = 'Yes' if row[_ROW_TEAM_ID] == page_team_id else 'No'
+                        pitching_rows.append(tuple(row))
 
-                    conn.commit()
-                    print(f"[DONE] Stats inserted for game {game_id}")
+                    print(f"[QUEUE] Stats queued for game {game_id}")
 
                 except Exception:
                     print(f"\n[ERROR] Failed to parse box score for {game_id}:")
                     traceback.print_exc()
                     continue
 
+        # One batched flush per table, all inside a single transaction –
+        # one synchronous log flush at commit instead of one per chunk. The
+        # two big stats tables go through SqlBulkCopy when arrowsqlbcpy is
+        # there (its own connection, outside this transaction).
+        try:
+            flush_batch(cursor, GAME_INSERT_SQL, game_rows, "game", GAME_INPUTSIZES)
+            bulk_load_stats(cursor, "GCBattingStatsTmp4", BATTING_COLUMNS,
+                            batting_rows, BATTING_INSERT_SQL, "batting")
+            bulk_load_stats(cursor, "GCPitchingStatsTmp4", PITCHING_COLUMNS,
+                            pitching_rows, PITCHING_INSERT_SQL, "pitching")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     except Exception:
         print("\n[FATAL] Unexpected error:")
         traceback.print_exc()
@@ -740,6 +993,7 @@ def main():
         try:
             cursor.close()
             conn.close()
+            get_db_connection.cache_clear()
         except:
             pass
         driver.quit()
@@ -79,3 +79,33 @@ TOURNAMENT_TEAMS = [
         "pool": "C",
     },
 ]
+
+# ---------------------------------------------------------------------------
+# Derived views, built once at import.
+#
+# TOURNAMENT_TEAMS stays the source of truth; the parallel lists below give
+# downstream code per-field scans without touching dicts, and the two index
+# dicts make by-id / by-pool lookups O(1) instead of a linear scan of the
+# list above.
+# ---------------------------------------------------------------------------
+
+TEAM_IDS = [t["team_id"] for t in TOURNAMENT_TEAMS]
+TEAM_LABELS = [t["label"] for t in TOURNAMENT_TEAMS]
+TEAM_POOLS = [t["pool"] for t in TOURNAMENT_TEAMS]
+
+_by_team_id = {t["team_id"]: i for i, t in enumerate(TOURNAMENT_TEAMS)}
+
+_by_pool = {}
+for _i, _t in enumerate(TOURNAMENT_TEAMS):
+    _by_pool.setdefault(_t["pool"], []).append(_i)
+
+
+def team_index_by_id(team_id):
+    """Index into TOURNAMENT_TEAMS (and the parallel lists) for a GC
+    TeamID, or None if the ID isn't in the tournament."""
+    return _by_team_id.get(team_id)
+
+
+def team_indices_in_pool(pool):
+    """Indices of every team in the given pool, in bracket order."""
+    return _by_pool.get(pool, [])
@@ -1,11 +1,15 @@
+import atexit
 import os
-import time
+import pickle
 import datetime
 import pyodbc
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from typing import List, Optional
 
+import httpx
 from dotenv import load_dotenv
+from selectolax.parser import HTMLParser
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -13,6 +17,19 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Optional bulk-copy path for big ingests; both extras must be present.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from arrowsqlbcpy import bulkcopy_from_pandas
+except ImportError:
+    bulkcopy_from_pandas = None
+
+USE_BCP = pd is not None and bulkcopy_from_pandas is not None
+
 
 # ----------------------------
 # Config / Models
@@ -73,14 +90,19 @@ def load_config() -> Config:
 # DB helpers
 # ----------------------------
 
-def get_db_connection(cfg: Config):
-    conn_str = (
+def build_conn_str(cfg: Config) -> str:
+    return (
         f"DRIVER={{ODBC Driver 17 for SQL Server}};"
         f"SERVER={cfg.sql_server};"
         f"DATABASE={cfg.sql_database};"
         "Trusted_Connection=yes;"
     )
-    return pyodbc.connect(conn_str)
+
+
+def get_db_connection(cfg: Config):
+    # Explicit transactions: every statement joins the open transaction and
+    # the server does one synchronous log flush per commit, not per row.
+    return pyodbc.connect(build_conn_str(cfg), autocommit=False)
 
 
 def reset_tournament_table(cursor):
@@ -89,15 +111,32 @@ def reset_tournament_table(cursor):
     print("[INFO] Cleared GCTournamentGamesTmp.")
 
 
-def insert_games(cursor, games: List[GameRow]):
+# Rows per executemany call; bounds the parameter buffer pyodbc builds
+# for fast_executemany on very large ingests.
+INSERT_CHUNK_SIZE = 10_000
+
+# Below this, the DataFrame + bulk-copy session setup costs more than the
+# batched INSERT it replaces.
+BCP_MIN_ROWS = 10_000
+
+GAME_COLS = (
+    "GameID", "GameDate", "TournamentName",
+    "HomeTeam", "AwayTeam", "HomeScore", "AwayScore", "Status",
+)
+
+
+def insert_games(cursor, games: List[GameRow], conn_str: Optional[str] = None):
     sql = """
         INSERT INTO dbo.GCTournamentGamesTmp
         (GameID, GameDate, TournamentName, HomeTeam, AwayTeam, HomeScore, AwayScore, Status)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?);
     """
-    for g in games:
-        cursor.execute(
-            sql,
+    if not games:
+        print("[INFO] No games to insert into GCTournamentGamesTmp.")
+        return
+
+    rows = [
+        (
             g.game_id,
             g.game_date,
             g.tournament_name,
@@ -107,6 +146,26 @@ def insert_games(cursor, games: List[GameRow]):
             g.away_score,
             g.status,
         )
+        for g in games
+    ]
+
+    # Big runs go through the server's bulk-load path instead of batched
+    # INSERTs: minimally logged into the heap reset_tournament_table just
+    # truncated, and no per-row parameter marshalling in pyodbc.
+    if USE_BCP and conn_str is not None and len(rows) >= BCP_MIN_ROWS:
+        df = pd.DataFrame(rows, columns=GAME_COLS)
+        bulkcopy_from_pandas(df, conn_str, "GCTournamentGamesTmp")
+        print(f"[INFO] Bulk-copied {len(games)} games into GCTournamentGamesTmp.")
+        return
+
+    # One round trip per chunk instead of one per row: fast_executemany
+    # packs all parameter sets into a single batched TDS exchange.
+    # NOCOUNT drops the per-row "1 row affected" messages from the reply
+    # stream; the whole batch then commits as one transaction.
+    cursor.execute("SET NOCOUNT ON")
+    cursor.fast_executemany = True
+    for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+        cursor.executemany(sql, rows[i:i + INSERT_CHUNK_SIZE])
     cursor.connection.commit()
     print(f"[INFO] Inserted {len(games)} games into GCTournamentGamesTmp.")
 
@@ -117,9 +176,21 @@ def insert_games(cursor, games: List[GameRow]):
 
 def build_chrome_options(cfg: Config) -> Options:
     options = Options()
-    options.add_argument("--start-maximized")
+    options.add_argument("--headless=new")
     options.add_argument("--disable-blink-features=AutomationControlled")
 
+    # Text extraction only: skip images and stylesheets, and return from
+    # driver.get on DOMContentLoaded instead of waiting for full load.
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+        },
+    )
+    options.page_load_strategy = "eager"
+
     if cfg.chrome_user_data_dir:
         options.add_argument(f"--user-data-dir={cfg.chrome_user_data_dir}")
     if cfg.chrome_profile_dir:
@@ -128,15 +199,69 @@ def build_chrome_options(cfg: Config) -> Options:
     return options
 
 
+# GC sessions last days, so the credential flow's cookies are pickled and
+# replayed on later runs (and by the worker processes) instead of typing
+# the login form again.
+COOKIE_JAR_PATH = "gc_cookies.pkl"
+
+
+def load_session_cookies(driver) -> bool:
+    """Seed the browser from the pickled cookie jar left by an earlier
+    login. Returns True when the restored session is still valid."""
+    if not os.path.exists(COOKIE_JAR_PATH):
+        return False
+    try:
+        with open(COOKIE_JAR_PATH, "rb") as f:
+            cookies = pickle.load(f)
+    except Exception as e:
+        print(f"[WARN] Could not read cookie jar {COOKIE_JAR_PATH}: {e}")
+        return False
+    # add_cookie only takes once the browser is on the GC domain.
+    driver.get("https://web.gc.com")
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue
+    driver.get("https://web.gc.com/teams")
+    # A dead session is bounced to /login as part of the navigation, so one
+    # URL check after driver.get decides; waiting a full timeout for the
+    # bounce charged every warm run a flat 8s.
+    if "login" in driver.current_url.lower():
+        print("[INFO] Saved cookies are stale; logging in fresh.")
+        return False
+    print("[INFO] Restored GameChanger session from cookie jar.")
+    return True
+
+
+def save_session_cookies(driver):
+    """Persist the live session's cookies so later runs can skip login."""
+    try:
+        with open(COOKIE_JAR_PATH, "wb") as f:
+            pickle.dump(driver.get_cookies(), f)
+        print(f"[INFO] Saved session cookies to {COOKIE_JAR_PATH}")
+    except Exception as e:
+        print(f"[WARN] Could not save cookie jar: {e}")
+
+
 def login_gamechanger(driver, cfg: Config):
+    if load_session_cookies(driver):
+        return
+
     driver.get("https://web.gc.com/login")
 
     wait = WebDriverWait(driver, 30)
 
-    # If already logged in (due to Chrome profile), GC might redirect automatically
-    time.sleep(5)
+    # If already logged in (due to Chrome profile), GC redirects away from
+    # /login; otherwise the email field appears. Wait for whichever comes
+    # first instead of sleeping a fixed 5s.
+    WebDriverWait(driver, 10).until(
+        lambda d: "login" not in d.current_url.lower()
+        or d.find_elements(By.CSS_SELECTOR, "input[type='email']")
+    )
     if "login" not in driver.current_url.lower():
         print("[INFO] Already logged in to GameChanger.")
+        save_session_cookies(driver)
         return
 
     print("[INFO] Logging into GameChanger...")
@@ -161,6 +286,7 @@ def login_gamechanger(driver, cfg: Config):
     # Wait for redirect away from login
     wait.until(lambda d: "login" not in d.current_url.lower())
     print("[INFO] Login successful.")
+    save_session_cookies(driver)
 
 
 # ----------------------------
@@ -177,74 +303,55 @@ def parse_int_safe(text: str) -> Optional[int]:
         return None
 
 
-def scrape_schedule_page_games(driver, schedule_url: str) -> List[GameRow]:
+def parse_schedule_page_html(html: str, schedule_url: str) -> List[GameRow]:
     """
-    Scrapes a single team schedule page for games.
+    Parse game cards out of a schedule page's static HTML, however it was
+    fetched (authenticated HTTP GET or Selenium render).
 
     NOTE: You may need to tweak the CSS selectors below to match GC's current DOM.
     """
-    print(f"[INFO] Loading schedule: {schedule_url}")
-    driver.get(schedule_url)
-
-    # Let the page + any lazy-loaded schedule render
-    time.sleep(5)
-
+    tree = HTMLParser(html)
     games: List[GameRow] = []
 
     # This part is DOM-dependent; adjust as needed.
     # Idea: each game is a "card" or "row" with teams, score, status, and a link.
-    game_cards = driver.find_elements(By.CSS_SELECTOR, "[data-testid='schedule-game-card'], .ScheduleGameCard")
+    game_cards = tree.css("[data-testid='schedule-game-card'], .ScheduleGameCard")
     print(f"[INFO] Found {len(game_cards)} potential game cards on page.")
 
     for card in game_cards:
-        try:
-            # Game link (used to derive GameID)
-            link_el = card.find_element(By.CSS_SELECTOR, "a[href*='/game-']")
-            game_url = link_el.get_attribute("href")
-            game_id = game_url.rstrip("/").split("/")[-1]
-
-            # Teams
-            home_team_el = card.find_element(By.CSS_SELECTOR, "[data-testid='home-team-name'], .ScheduleGameCard__homeTeam")
-            away_team_el = card.find_element(By.CSS_SELECTOR, "[data-testid='away-team-name'], .ScheduleGameCard__awayTeam")
-            home_team = home_team_el.text.strip()
-            away_team = away_team_el.text.strip()
-
-            # Score + status
-            status_el = card.find_element(By.CSS_SELECTOR, "[data-testid='game-status'], .ScheduleGameCard__status")
-            status = status_el.text.strip()  # e.g. "Final", "Scheduled"
-
-            home_score = None
-            away_score = None
-            try:
-                home_score_el = card.find_element(By.CSS_SELECTOR, "[data-testid='home-team-score'], .ScheduleGameCard__homeScore")
-                away_score_el = card.find_element(By.CSS_SELECTOR, "[data-testid='away-team-score'], .ScheduleGameCard__awayScore")
-                home_score = parse_int_safe(home_score_el.text)
-                away_score = parse_int_safe(away_score_el.text)
-            except NoSuchElementException:
-                # Scores might not exist for unplayed games
-                pass
-
-            # Date (optional)
-            game_date = None
-            try:
-                date_el = card.find_element(By.CSS_SELECTOR, "[data-testid='game-date'], .ScheduleGameCard__date")
-                # This may need custom parsing; for now just keep as None or raw text
-                # You can parse to datetime if you know the format.
-                # game_date = datetime.datetime.strptime(date_el.text.strip(), "%b %d, %Y %I:%M %p")
-                # For now, leave None
-                _ = date_el.text  # placeholder
-            except NoSuchElementException:
-                pass
-
-            # Tournament name (optional)
-            tournament_name = None
-            try:
-                tour_el = card.find_element(By.CSS_SELECTOR, "[data-testid='event-name'], .ScheduleGameCard__eventName")
-                tournament_name = tour_el.text.strip()
-            except NoSuchElementException:
-                pass
-
-            game = GameRow(
+        # Game link (used to derive GameID)
+        link_el = card.css_first("a[href*='/game-']")
+        home_team_el = card.css_first("[data-testid='home-team-name'], .ScheduleGameCard__homeTeam")
+        away_team_el = card.css_first("[data-testid='away-team-name'], .ScheduleGameCard__awayTeam")
+        status_el = card.css_first("[data-testid='game-status'], .ScheduleGameCard__status")
+
+        if not (link_el and home_team_el and away_team_el and status_el):
+            # If this card doesn't match the expected pattern, skip but log
+            print("[WARN] Skipped a card due to missing expected elements.")
+            continue
+
+        game_url = link_el.attributes.get("href") or ""
+        game_id = game_url.rstrip("/").split("/")[-1]
+        home_team = home_team_el.text().strip()
+        away_team = away_team_el.text().strip()
+        status = status_el.text().strip()  # e.g. "Final", "Scheduled"
+
+        # Scores might not exist for unplayed games
+        home_score_el = card.css_first("[data-testid='home-team-score'], .ScheduleGameCard__homeScore")
+        away_score_el = card.css_first("[data-testid='away-team-score'], .ScheduleGameCard__awayScore")
+        home_score = parse_int_safe(home_score_el.text()) if home_score_el else None
+        away_score = parse_int_safe(away_score_el.text()) if away_score_el else None
+
+        # Date (optional) – needs custom parsing once the format is pinned
+        # down, so keep None for now.
+        game_date = None
+
+        # Tournament name (optional)
+        tour_el = card.css_first("[data-testid='event-name'], .ScheduleGameCard__eventName")
+        tournament_name = tour_el.text().strip() if tour_el else None
+
+        games.append(
+            GameRow(
                 game_id=game_id,
                 game_date=game_date,
                 tournament_name=tournament_name,
@@ -254,17 +361,48 @@ def scrape_schedule_page_games(driver, schedule_url: str) -> List[GameRow]:
                 away_score=away_score,
                 status=status,
             )
-            games.append(game)
-
-        except NoSuchElementException:
-            # If this card doesn't match the expected pattern, skip but log
-            print("[WARN] Skipped a card due to missing expected elements.")
-            continue
+        )
 
     print(f"[INFO] Parsed {len(games)} games from {schedule_url}")
     return games
 
 
+def scrape_schedule_page_games(driver, schedule_url: str, http_client=None) -> List[GameRow]:
+    """
+    Scrape a single team schedule page for games. HTTP-first: fetch the
+    page over the authenticated client and parse it statically, skipping
+    the Chrome render entirely; only pages whose static HTML carries no
+    game cards (or failed GETs) pay for a Selenium load.
+    """
+    print(f"[INFO] Loading schedule: {schedule_url}")
+
+    if http_client is not None:
+        try:
+            resp = http_client.get(schedule_url)
+            resp.raise_for_status()
+            games = parse_schedule_page_html(resp.text, schedule_url)
+            if games:
+                return games
+            print(f"[WARN] No cards in static HTML for {schedule_url}; falling back to Selenium.")
+        except httpx.HTTPError as e:
+            print(f"[WARN] HTTP schedule fetch failed for {schedule_url} ({e}); falling back to Selenium.")
+
+    driver.get(schedule_url)
+
+    # Wait for the first game card instead of sleeping a fixed 5s; pages
+    # usually render well under a second.
+    try:
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "[data-testid='schedule-game-card'], .ScheduleGameCard")
+            )
+        )
+    except TimeoutException:
+        print(f"[WARN] No game cards appeared for {schedule_url}")
+
+    return parse_schedule_page_html(driver.page_source, schedule_url)
+
+
 def filter_games_by_tournament(games: List[GameRow], tournament_filter: Optional[str]) -> List[GameRow]:
     if not tournament_filter:
         return games
@@ -275,6 +413,43 @@ def filter_games_by_tournament(games: List[GameRow], tournament_filter: Optional
     return filtered
 
 
+# ----------------------------
+# Parallel scraping
+# ----------------------------
+
+# Schedule URLs are embarrassingly parallel; WebDriver is not thread-safe,
+# so each worker process owns one headless Chrome, created and logged in
+# once by the pool initializer and reused for every URL that worker pulls.
+SCRAPE_WORKERS = 4
+
+_worker_driver = None
+_worker_http = None
+
+
+def _init_scrape_worker(cfg: Config):
+    """Process-pool initializer: start this worker's Chrome and log in."""
+    global _worker_driver, _worker_http
+    # Chrome allows one live instance per user-data-dir, so workers skip
+    # the shared profile and log in with the env credentials instead.
+    worker_cfg = replace(cfg, chrome_user_data_dir=None, chrome_profile_dir=None)
+    options = build_chrome_options(worker_cfg)
+    _worker_driver = webdriver.Chrome(options=options)
+    atexit.register(_worker_driver.quit)
+    login_gamechanger(_worker_driver, worker_cfg)
+    # Reuse the logged-in session's cookies over plain HTTP so most
+    # schedule pages never need a Chrome render.
+    _worker_http = httpx.Client(
+        cookies={c["name"]: c["value"] for c in _worker_driver.get_cookies()},
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=30.0,
+        follow_redirects=True,
+    )
+
+
+def _scrape_url_worker(url: str) -> List[GameRow]:
+    return scrape_schedule_page_games(_worker_driver, url, _worker_http)
+
+
 # ----------------------------
 # Main
 # ----------------------------
@@ -288,24 +463,28 @@ def main():
 
     reset_tournament_table(cursor)
 
-    chrome_options = build_chrome_options(cfg)
-    driver = webdriver.Chrome(options=chrome_options)
-
     try:
-        login_gamechanger(driver, cfg)
-
         all_games: List[GameRow] = []
 
-        for url in cfg.team_schedule_urls:
-            schedule_games = scrape_schedule_page_games(driver, url)
-            schedule_games = filter_games_by_tournament(schedule_games, cfg.tournament_filter)
-            all_games.extend(schedule_games)
+        with ProcessPoolExecutor(
+            max_workers=min(SCRAPE_WORKERS, len(cfg.team_schedule_urls)),
+            initializer=_init_scrape_worker,
+            initargs=(cfg,),
+        ) as pool:
+            futures = [
+                pool.submit(_scrape_url_worker, url)
+                for url in cfg.team_schedule_urls
+            ]
+            for future in as_completed(futures):
+                schedule_games = filter_games_by_tournament(
+                    future.result(), cfg.tournament_filter
+                )
+                all_games.extend(schedule_games)
 
         print(f"[INFO] Total games collected (after filtering): {len(all_games)}")
-        insert_games(cursor, all_games)
+        insert_games(cursor, all_games, conn_str=build_conn_str(cfg))
 
     finally:
-        driver.quit()
         cursor.close()
         conn.close()
         print("[INFO] Done.")
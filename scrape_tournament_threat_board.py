@@ -1,11 +1,23 @@
+import atexit
+import functools
+import gzip
 import os
+import pickle
 import re
 import csv
-import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple, Set
 
+import httpx
 from dotenv import load_dotenv
+from selectolax.parser import HTMLParser
+
+# Optional: vectorized aggregation for big tournaments.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException
@@ -86,7 +98,7 @@ def load_config() -> Config:
 
 def build_chrome_options(cfg: Config) -> Options:
     opts = Options()
-    opts.add_argument("--start-maximized")
+    opts.add_argument("--headless=new")
     opts.add_argument("--disable-blink-features=AutomationControlled")
 
     # Extra stability flags
@@ -94,6 +106,18 @@ def build_chrome_options(cfg: Config) -> Options:
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
 
+    # Text extraction only: skip images and stylesheets, and return from
+    # driver.get on DOMContentLoaded instead of waiting for full load.
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+        },
+    )
+    opts.page_load_strategy = "eager"
+
     # For now, do NOT use your normal Chrome profile while we stabilize.
     # If you want to re-enable later, uncomment below:
     # if cfg.chrome_user_data_dir:
@@ -108,7 +132,55 @@ def build_chrome_options(cfg: Config) -> Options:
 # GameChanger login
 # ----------------------------
 
+# GC sessions last days, so the credential flow's cookies are pickled and
+# replayed on later runs (and by the worker processes) instead of typing
+# the login form again.
+COOKIE_JAR_PATH = "gc_cookies.pkl"
+
+
+def load_session_cookies(driver) -> bool:
+    """Seed the browser from the pickled cookie jar left by an earlier
+    login. Returns True when the restored session is still valid."""
+    if not os.path.exists(COOKIE_JAR_PATH):
+        return False
+    try:
+        with open(COOKIE_JAR_PATH, "rb") as f:
+            cookies = pickle.load(f)
+    except Exception as e:
+        print(f"[WARN] Could not read cookie jar {COOKIE_JAR_PATH}: {e}")
+        return False
+    # add_cookie only takes once the browser is on the GC domain.
+    driver.get("https://web.gc.com")
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue
+    driver.get("https://web.gc.com/teams")
+    # A dead session is bounced to /login as part of the navigation, so one
+    # URL check after driver.get decides; waiting a full timeout for the
+    # bounce charged every warm run a flat 8s.
+    if "login" in driver.current_url.lower():
+        print("[INFO] Saved cookies are stale; logging in fresh.")
+        return False
+    print("[INFO] Restored GameChanger session from cookie jar.")
+    return True
+
+
+def save_session_cookies(driver):
+    """Persist the live session's cookies so later runs can skip login."""
+    try:
+        with open(COOKIE_JAR_PATH, "wb") as f:
+            pickle.dump(driver.get_cookies(), f)
+        print(f"[INFO] Saved session cookies to {COOKIE_JAR_PATH}")
+    except Exception as e:
+        print(f"[WARN] Could not save cookie jar: {e}")
+
+
 def login_gamechanger(driver, cfg: Config):
+    if load_session_cookies(driver):
+        return
+
     driver.get("https://web.gc.com/login")
     wait = WebDriverWait(driver, 30)
 
@@ -138,12 +210,18 @@ def login_gamechanger(driver, cfg: Config):
     # Wait until we're no longer on the login page
     wait.until(lambda d: "login" not in d.current_url.lower())
     print("[INFO] Login successful. Now at:", driver.current_url)
+    save_session_cookies(driver)
 
 
 # ----------------------------
 # Scraping helpers
 # ----------------------------
 
+# Matches "W 13-2" / "L 6-8" result texts in one pass; compiled once so
+# per-card parsing is a single match instead of startswith+split chains.
+_SCORE_RE = re.compile(r"^([WL])\s+(\d+)-(\d+)$")
+
+
 def parse_int_safe(text: str) -> Optional[int]:
     if text is None:
         return None
@@ -156,58 +234,42 @@ def parse_int_safe(text: str) -> Optional[int]:
         return None
 
 
-def scrape_schedule_games(driver, url: str) -> List[Game]:
+def parse_schedule_html(html: str, url: str) -> Tuple[List[Game], str]:
     """
-    Scrape games from a team schedule page using the new GC DOM structure.
+    Parse games out of a schedule page's static HTML, however it was
+    fetched (authenticated HTTP GET or Selenium render). Returns the games
+    plus the schedule team's name from the page header.
     """
-    print(f"[INFO] Loading schedule: {url}")
-    driver.get(url)
-    time.sleep(3)
+    tree = HTMLParser(html)
 
-    games: List[Game] = []
-
-    # Get the team name from the page header (top nav)
     team_name = "Unknown Team"
-    try:
-        wait = WebDriverWait(driver, 10)
-        team_name_el = wait.until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, ".NewTeamNavBar__teamName")
-            )
-        )
-        team_name = team_name_el.text.strip()
-    except TimeoutException:
+    team_name_el = tree.css_first(".NewTeamNavBar__teamName")
+    if team_name_el:
+        team_name = team_name_el.text().strip() or team_name
+    else:
         print("[WARN] Could not find team name header; using 'Unknown Team'.")
 
-    # Record this schedule team as one we explicitly scraped
-    SCRAPED_TEAM_NAMES.add(team_name)
-    print(f"[INFO] Schedule team recorded: {team_name!r}")
+    games: List[Game] = []
 
     # Each game/event is an <a> with this class
-    game_cards = driver.find_elements(By.CSS_SELECTOR, "a.ScheduleListByMonth__event")
+    game_cards = tree.css("a.ScheduleListByMonth__event")
     print(f"[INFO] Found {len(game_cards)} schedule events.")
 
     for card in game_cards:
         try:
             # Game ID from href
-            href = card.get_attribute("href")
+            href = card.attributes.get("href") or ""
             if not href:
                 continue
             game_id = href.rstrip("/").split("/")[-1]
 
             # Opponent name (e.g. "@ Delmarva Aces Beach 12U")
-            title_el = card.find_element(
-                By.CSS_SELECTOR,
-                ".ScheduleListByMonth__title .Text__semibold"
-            )
-            opponent = title_el.text.strip()
+            title_el = card.css_first(".ScheduleListByMonth__title .Text__semibold")
+            opponent = title_el.text().strip() if title_el else ""
 
             # Score / time / status text (e.g. "W 13-2", "L 6-8", "12:00 PM")
-            score_el = card.find_element(
-                By.CSS_SELECTOR,
-                ".ScheduleListByMonth__scoreOrTimeText"
-            )
-            score_text = score_el.text.strip()
+            score_el = card.css_first(".ScheduleListByMonth__scoreOrTimeText")
+            score_text = score_el.text().strip() if score_el else ""
 
             status = "Scheduled"
             home_score = None
@@ -218,16 +280,11 @@ def scrape_schedule_games(driver, url: str) -> List[Game]:
             # "L 6-8"   (schedule team lost 6–8)
             # "Final"   (scores might be somewhere else – we skip for now)
             # "12:00 PM" (future game)
-            if score_text.startswith("W "):
+            m = _SCORE_RE.match(score_text)
+            if m:
                 status = "Final"
-                parts = score_text.split(" ")[1].split("-")
-                home_score = int(parts[0])
-                away_score = int(parts[1])
-            elif score_text.startswith("L "):
-                status = "Final"
-                parts = score_text.split(" ")[1].split("-")
-                home_score = int(parts[0])
-                away_score = int(parts[1])
+                home_score = int(m.group(2))
+                away_score = int(m.group(3))
             elif score_text == "Final":
                 status = "Final"
                 # No scores provided; we skip these when aggregating.
@@ -257,6 +314,47 @@ def scrape_schedule_games(driver, url: str) -> List[Game]:
             continue
 
     print(f"[INFO] Parsed {len(games)} games from {url}")
+    return games, team_name
+
+
+def scrape_schedule_games(driver, url: str, http_client=None) -> List[Game]:
+    """
+    Scrape games from a team schedule page. HTTP-first: fetch the page over
+    the authenticated client and parse it statically, skipping the Chrome
+    render entirely; only pages whose static HTML carries no schedule
+    events (or failed GETs) pay for a Selenium load.
+    """
+    print(f"[INFO] Loading schedule: {url}")
+
+    games: List[Game] = []
+    team_name = "Unknown Team"
+
+    if http_client is not None:
+        try:
+            resp = http_client.get(url)
+            resp.raise_for_status()
+            games, team_name = parse_schedule_html(resp.text, url)
+            if not games:
+                print(f"[WARN] No events in static HTML for {url}; falling back to Selenium.")
+        except httpx.HTTPError as e:
+            print(f"[WARN] HTTP schedule fetch failed for {url} ({e}); falling back to Selenium.")
+
+    if not games:
+        driver.get(url)
+        # Wait for the first schedule event instead of sleeping a fixed 3s.
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "a.ScheduleListByMonth__event")
+                )
+            )
+        except TimeoutException:
+            print(f"[WARN] No schedule events appeared for {url}")
+        games, team_name = parse_schedule_html(driver.page_source, url)
+
+    # Record this schedule team as one we explicitly scraped
+    SCRAPED_TEAM_NAMES.add(team_name)
+    print(f"[INFO] Schedule team recorded: {team_name!r}")
     return games
 
 
@@ -285,16 +383,48 @@ def filter_games_for_tournament(
 # Aggregation: build team CSV
 # ----------------------------
 
+# Leading "vs. " / "vs " / "@ " markers from the schedule card titles.
+_TEAM_PREFIX_RE = re.compile(r"^(?:vs\.?\s+|@\s+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=2048)
 def normalize_team_name(name: str) -> str:
+    # Cached: a tournament has few unique names but normalizes one per
+    # game side, so repeat calls are dict hits.
     if not name:
         return ""
-    n = name.strip()
-    lower = n.lower()
-    for prefix in ("vs. ", "vs ", "@ "):
-        if lower.startswith(prefix):
-            n = n[len(prefix):].strip()
-            break
-    return n
+    return _TEAM_PREFIX_RE.sub("", name.strip())
+
+
+# Below this, DataFrame construction costs more than the dict loop saves.
+_VECTORIZE_MIN_GAMES = 64
+
+
+def _build_team_totals_vectorized(finals: List[Game]) -> Dict[str, Dict[str, int]]:
+    """pandas groupby equivalent of the scalar totals loop: one long row
+    per (game, side), summed per team at C speed. Ties count toward G,
+    RS, and RA but neither W nor L, matching the scalar path."""
+    home = pd.DataFrame(
+        {
+            "team": [normalize_team_name(g.home_team) for g in finals],
+            "RS": [g.home_score for g in finals],
+            "RA": [g.away_score for g in finals],
+        }
+    )
+    away = pd.DataFrame(
+        {
+            "team": [normalize_team_name(g.away_team) for g in finals],
+            "RS": home["RA"],
+            "RA": home["RS"],
+        }
+    )
+    long = pd.concat([home, away], ignore_index=True)
+    long["G"] = 1
+    long["W"] = (long["RS"] > long["RA"]).astype(int)
+    long["L"] = (long["RS"] < long["RA"]).astype(int)
+
+    totals = long.groupby("team")[["G", "W", "L", "RS", "RA"]].sum().astype(int)
+    return totals.to_dict("index")
 
 
 def build_team_totals(games: List[Game]) -> Dict[str, Dict[str, int]]:
@@ -311,18 +441,24 @@ def build_team_totals(games: List[Game]) -> Dict[str, Dict[str, int]]:
       ...
     }
     """
+    finals = [
+        g
+        for g in games
+        if g.status.lower() == "final"
+        and g.home_score is not None
+        and g.away_score is not None
+    ]
+
+    if pd is not None and len(finals) >= _VECTORIZE_MIN_GAMES:
+        return _build_team_totals_vectorized(finals)
+
     teams: Dict[str, Dict[str, int]] = {}
 
     def ensure(team: str):
         if team not in teams:
             teams[team] = {"G": 0, "W": 0, "L": 0, "RS": 0, "RA": 0}
 
-    for g in games:
-        if g.status.lower() != "final":
-            continue
-        if g.home_score is None or g.away_score is None:
-            continue
-
+    for g in finals:
         home = normalize_team_name(g.home_team)
         away = normalize_team_name(g.away_team)
 
@@ -355,6 +491,29 @@ def write_tournament_csv(path: str, teams: Dict[str, Dict[str, int]]):
     Writes CSV with columns: Team,Pool,G,W,L,RS,RA
     Pool left blank for now (you can edit in Excel if desired).
     """
+    if pd is not None and teams:
+        df = pd.DataFrame.from_dict(teams, orient="index")
+        df.insert(0, "Pool", "")  # fill manually for now
+
+        # Same ordering as the scalar path: win% desc, then run diff, then RS.
+        df["win_pct"] = df["W"] / df["G"].clip(lower=1)
+        df["RD"] = df["RS"] - df["RA"]
+        df = df.sort_values(["win_pct", "RD", "RS"], ascending=False)
+
+        cols = ["Pool", "G", "W", "L", "RS", "RA"]
+        df.to_csv(path, index_label="Team", columns=cols, encoding="utf-8")
+        # Precompressed sibling; the dashboard serves it to gzip-capable
+        # clients instead of recompressing per request.
+        df.to_csv(
+            path + ".gz",
+            index_label="Team",
+            columns=cols,
+            encoding="utf-8",
+            compression="gzip",
+        )
+        print(f"[INFO] Wrote {len(df)} teams to {path} (+ .gz)")
+        return
+
     rows: List[Tuple[str, str, int, int, int, int, int]] = []
 
     for team, stats in teams.items():
@@ -384,7 +543,51 @@ def write_tournament_csv(path: str, teams: Dict[str, Dict[str, int]]):
         writer.writerow(["Team", "Pool", "G", "W", "L", "RS", "RA"])
         writer.writerows(rows)
 
-    print(f"[INFO] Wrote {len(rows)} teams to {path}")
+    # Keep the precompressed sibling in lockstep with the plain file; the
+    # dashboard prefers the .gz, so a stale one would keep serving the
+    # previous run's standings.
+    with gzip.open(path + ".gz", "wt", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Team", "Pool", "G", "W", "L", "RS", "RA"])
+        writer.writerows(rows)
+
+    print(f"[INFO] Wrote {len(rows)} teams to {path} (+ .gz)")
+
+
+# ----------------------------
+# Parallel scraping
+# ----------------------------
+
+# Schedule URLs are embarrassingly parallel; WebDriver is not thread-safe,
+# so each worker process owns one headless Chrome, created and logged in
+# once by the pool initializer and reused for every URL that worker pulls.
+SCRAPE_WORKERS = 4
+
+_worker_driver = None
+_worker_http = None
+
+
+def _init_scrape_worker(cfg: Config):
+    """Process-pool initializer: start this worker's Chrome, log in, and
+    build the authenticated HTTP client the fast path fetches through."""
+    global _worker_driver, _worker_http
+    options = build_chrome_options(cfg)
+    _worker_driver = webdriver.Chrome(options=options)
+    atexit.register(_worker_driver.quit)
+    login_gamechanger(_worker_driver, cfg)
+    _worker_http = httpx.Client(
+        cookies={c["name"]: c["value"] for c in _worker_driver.get_cookies()},
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=30.0,
+        follow_redirects=True,
+    )
+
+
+def _scrape_url_worker(url: str) -> Tuple[List[Game], List[str]]:
+    games = scrape_schedule_games(_worker_driver, url, _worker_http)
+    # SCRAPED_TEAM_NAMES lives in this worker process; ship it back so the
+    # parent can merge it into its own set.
+    return games, list(SCRAPED_TEAM_NAMES)
 
 
 # ----------------------------
@@ -397,16 +600,22 @@ def main():
     print(f"[INFO] Tournament: {cfg.tournament_name!r}")
     print(f"[INFO] Output CSV: {cfg.output_csv!r}")
 
-    options = build_chrome_options(cfg)
-    driver = webdriver.Chrome(options=options)
-
     try:
-        login_gamechanger(driver, cfg)
-
         all_games: List[Game] = []
-        for url in cfg.team_schedule_urls:
-            g = scrape_schedule_games(driver, url)
-            all_games.extend(g)
+
+        with ProcessPoolExecutor(
+            max_workers=min(SCRAPE_WORKERS, len(cfg.team_schedule_urls)),
+            initializer=_init_scrape_worker,
+            initargs=(cfg,),
+        ) as pool:
+            futures = [
+                pool.submit(_scrape_url_worker, url)
+                for url in cfg.team_schedule_urls
+            ]
+            for future in as_completed(futures):
+                games, team_names = future.result()
+                all_games.extend(games)
+                SCRAPED_TEAM_NAMES.update(team_names)
 
         print(f"[INFO] Total games scraped: {len(all_games)}")
 
@@ -432,7 +641,6 @@ def main():
         write_tournament_csv(cfg.output_csv, filtered_team_totals)
 
     finally:
-        driver.quit()
         print("[INFO] Done.")
 
 
@@ -1,15 +1,30 @@
+import hmac
+import json
+import mimetypes
 import os
-from functools import wraps
+import re
+import time
+from functools import lru_cache, partial, wraps
 from datetime import datetime, timezone
 
 from flask import (
+    Blueprint,
     Flask,
     send_from_directory,
     jsonify,
     abort,
+    make_response,
     request,
     Response,
 )
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from werkzeug.security import safe_join
+
+# Optional: C-level JSON serialization for the API responses.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ----- Paths -----
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -25,14 +40,56 @@ app = Flask(
     static_url_path=""  # so /team-hitting.html works directly
 )
 
+# Behind Apache/mod_xsendfile (or anything honoring X-Sendfile), Flask's
+# send helpers emit the header and the front end does the body transfer.
+# nginx deployments use the ACES_ACCEL_* prefixes below instead.
+app.use_x_sendfile = bool(os.environ.get("ACES_USE_X_SENDFILE"))
+
+# One rule per path instead of a rule + redirect twin for the slashless
+# form; halves the match set werkzeug has to consider.
+app.url_map.strict_slashes = False
+
 # ----- Simple HTTP Basic Auth -----
 
 BASIC_AUTH_USER = os.environ.get("ACES_USER", "coach")
 BASIC_AUTH_PASS = os.environ.get("ACES_PASS", "changeme")
 
 
+# After a successful Basic check, a signed cookie lets the browser skip
+# the credential comparison on the dozens of asset/API fetches that make
+# up a page load. Set ACES_SECRET_KEY in production so every worker
+# signs with the same key.
+AUTH_COOKIE = "aces_auth"
+AUTH_COOKIE_MAX_AGE = 3600  # seconds
+
+_cookie_signer = URLSafeTimedSerializer(
+    os.environ.get("ACES_SECRET_KEY", BASIC_AUTH_PASS),
+    salt="aces-auth",
+)
+
+
+# Encoded once at startup; compare_digest runs its branch-free path on
+# bytes, where str input can hit unicode fast paths.
+_USER_BYTES = BASIC_AUTH_USER.encode()
+_PASS_BYTES = BASIC_AUTH_PASS.encode()
+
+
+@lru_cache(maxsize=256)
 def check_auth(username: str, password: str) -> bool:
-    return username == BASIC_AUTH_USER and password == BASIC_AUTH_PASS
+    # compare_digest + bitwise AND keeps the comparison constant-time so
+    # response timing leaks nothing about how much of a guess matched.
+    # The lru_cache turns the common case — one browser re-sending the
+    # same Basic header for every asset — into a dict hit; a cache hit
+    # reveals only that the exact pair was seen before, not how close a
+    # miss came.
+    try:
+        user_bytes = username.encode()
+        pass_bytes = password.encode()
+    except AttributeError:
+        return False
+    return hmac.compare_digest(user_bytes, _USER_BYTES) & hmac.compare_digest(
+        pass_bytes, _PASS_BYTES
+    )
 
 
 def authenticate() -> Response:
@@ -46,18 +103,114 @@ def authenticate() -> Response:
 def requires_auth(f):
     @wraps(f)
     def decorated(*args, **kwargs):
+        cookie = request.cookies.get(AUTH_COOKIE)
+        if cookie is not None:
+            try:
+                _cookie_signer.loads(cookie, max_age=AUTH_COOKIE_MAX_AGE)
+                return f(*args, **kwargs)
+            except BadSignature:
+                pass  # expired or tampered; fall through to Basic auth
+
         auth = request.authorization
         if not auth or not check_auth(auth.username, auth.password):
             return authenticate()
-        return f(*args, **kwargs)
+
+        resp = make_response(f(*args, **kwargs))
+        resp.set_cookie(
+            AUTH_COOKIE,
+            _cookie_signer.dumps(auth.username),
+            max_age=AUTH_COOKIE_MAX_AGE,
+            httponly=True,
+            secure=request.is_secure,  # keeps plain-HTTP local dev working
+            samesite="Lax",
+        )
+        return resp
     return decorated
 
 
 # ----- Helpers -----
 
+def _json_response(obj):
+    """jsonify, but through orjson's C serializer when it's installed."""
+    if orjson is None:
+        return jsonify(obj)
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
+
+# (dir_path, prefix) -> (dir mtime, time cached, index, newest csv mtime,
+# seasons list).
+# The CSV directories only change when a scrape drops a new file (which
+# bumps the directory mtime), so every request in between reuses the last
+# scan instead of re-listing and re-parsing the directory. The TTL forces
+# an occasional rescan anyway, guarding against filesystems with coarse
+# mtime resolution.
+_season_dir_cache = {}
+_SEASON_CACHE_TTL = 30.0  # seconds
+
+
+def _scan_season_dir(dir_path: str, prefix: str):
+    """
+    One cached pass over dir_path, returning (index, latest_mtime, seasons)
+    where index maps season_id -> filename, latest_mtime is the newest
+    CSV's mtime (None if there are no CSVs), and seasons is the JSON-ready
+    list the /seasons endpoints return.
+    """
+    if not os.path.isdir(dir_path):
+        return {}, None, []
+
+    now = time.monotonic()
+    dir_mtime = os.stat(dir_path).st_mtime
+    cached = _season_dir_cache.get((dir_path, prefix))
+    if (
+        cached is not None
+        and cached[0] == dir_mtime
+        and now - cached[1] < _SEASON_CACHE_TTL
+    ):
+        return cached[2], cached[3], cached[4]
+
+    index = {}
+    seasons = []
+    latest_mtime = None
+    low_prefix = prefix.lower() if prefix else ""
+
+    # scandir: one pass, and entry.stat() reuses what the directory read
+    # already fetched instead of a second stat per file. The index, the
+    # seasons list, and the newest mtime all come out of this one loop.
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            fname = entry.name
+            if not fname.lower().endswith(".csv"):
+                continue
+
+            base = os.path.splitext(fname)[0]  # strip extension
+            low_base = base.lower()
+
+            if low_prefix and low_base.startswith(low_prefix):
+                # Strip the prefix in a case-insensitive way
+                season_low = low_base[len(low_prefix):]
+            else:
+                season_low = low_base
+
+            index[season_low] = fname
+            seasons.append({"id": season_low, "label": _make_label(season_low)})
+
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if latest_mtime is None or mtime > latest_mtime:
+                latest_mtime = mtime
+
+    seasons.sort(key=lambda s: s["label"])
+    _season_dir_cache[(dir_path, prefix)] = (
+        dir_mtime, now, index, latest_mtime, seasons,
+    )
+    return index, latest_mtime, seasons
+
+
 def _build_season_index(dir_path: str, prefix: str):
     """
-    Build a case-insensitive index of season_id -> filename for CSVs in dir_path.
+    Case-insensitive index of season_id -> filename for CSVs in dir_path.
 
     Example return:
       {
@@ -65,123 +218,211 @@ def _build_season_index(dir_path: str, prefix: str):
         "spring2025": "hitting_spring2025.csv",
       }
     """
-    index = {}
+    return _scan_season_dir(dir_path, prefix)[0]
 
-    if not os.path.isdir(dir_path):
-        return index
 
-    low_prefix = prefix.lower() if prefix else ""
+# Points at the first digit, e.g. "fall2025" -> "fall 2025" after the sub.
+_LABEL_DIGIT_RE = re.compile(r"(?=\d)")
+
+
+@lru_cache(maxsize=512)
+def _make_label(season_low: str) -> str:
+    """'fall2025' -> 'Fall 2025'. Cached: the same handful of season ids
+    is re-labelled on every /seasons request."""
+    raw = season_low.replace("-", " ").replace("_", " ")
+    raw = _LABEL_DIGIT_RE.sub(" ", raw, count=1)
+    return " ".join(w.capitalize() for w in raw.split())
 
-    for fname in os.listdir(dir_path):
-        if not fname.lower().endswith(".csv"):
-            continue
 
-        base = os.path.splitext(fname)[0]  # strip extension
-        low_base = base.lower()
+# When running behind nginx, set ACES_ACCEL_PREFIX (e.g. "/_internal") and
+# configure:  location /_internal/ { internal; alias <...>/data/; }
+# Auth still runs in Flask; nginx then streams the CSV body itself with
+# sendfile(2) instead of pushing the bytes through Python.
+ACCEL_PREFIX = os.environ.get("ACES_ACCEL_PREFIX")
 
-        if low_prefix and low_base.startswith(low_prefix):
-            # Strip the prefix in a case-insensitive way
-            season_low = low_base[len(low_prefix):]
-        else:
-            season_low = low_base
+# Same idea for the static assets: an internal nginx location aliased to
+# the static directory, e.g.  location /_static/ { internal; alias <...>/static/; }
+ACCEL_STATIC_PREFIX = os.environ.get("ACES_ACCEL_STATIC_PREFIX")
 
-        index[season_low] = fname
 
-    return index
+# The handful of asset types this app actually serves, resolved with a
+# dict hit instead of a mimetypes.guess_type call per request. Anything
+# else falls back to guess_type.
+_MIME = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+    ".json": "application/json",
+}
 
 
-def _season_list_from_index(index: dict):
+def _send_static(filename: str):
     """
-    Turn a season index { "fall2025": "..." } into a list of
-    {"id": "fall2025", "label": "Fall 2025"} sorted by label.
+    Serve a file from STATIC_DIR, offloading the body to nginx when
+    ACES_ACCEL_STATIC_PREFIX is configured.
     """
-    seasons = []
+    ext = os.path.splitext(filename)[1].lower()
+    mimetype = _MIME.get(ext)
+
+    if ACCEL_STATIC_PREFIX:
+        if safe_join(STATIC_DIR, filename) is None:
+            abort(404)
+        if mimetype is None:
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        return Response(
+            headers={
+                "X-Accel-Redirect": f"{ACCEL_STATIC_PREFIX}/{filename}",
+                "Content-Type": mimetype,
+            }
+        )
 
-    for season_low in index.keys():
-        label_raw = season_low.replace("-", " ").replace("_", " ")
+    return send_from_directory(
+        STATIC_DIR, filename, mimetype=mimetype, conditional=True
+    )
 
-        # Insert a space before the first digit, e.g. "fall2025" -> "fall 2025"
-        for i, ch in enumerate(label_raw):
-            if ch.isdigit():
-                label_raw = label_raw[:i] + " " + label_raw[i:]
-                break
+# Past-season CSVs are historical and never rewritten, so they can be
+# cached indefinitely once ACES_CURRENT_SEASON says which season is still
+# live (e.g. "fall2025"). Unset, every CSV is treated as live.
+CURRENT_SEASON = os.environ.get("ACES_CURRENT_SEASON", "").lower()
 
-        label = " ".join(w.capitalize() for w in label_raw.split())
-        seasons.append({"id": season_low, "label": label})
+_CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+_CACHE_LIVE = "public, max-age=60, must-revalidate"
 
-    seasons.sort(key=lambda s: s["label"])
-    return seasons
 
+def _gz_is_fresh(csv_path: str) -> bool:
+    """True when a .gz sibling exists and is at least as new as the plain
+    file; a CSV regenerated without re-gzipping must fall through to the
+    plain file rather than serve the old compressed bytes forever."""
+    try:
+        return os.path.getmtime(csv_path + ".gz") >= os.path.getmtime(csv_path)
+    except OSError:
+        return False
 
-def _get_last_updated_for_dir(dir_path: str):
+
+def _send_csv(dir_path: str, fname: str, immutable: bool = False):
     """
-    Return ISO 8601 UTC timestamp for the newest CSV in dir_path,
-    or None if there are no CSVs.
+    Serve a CSV, preferring a precompressed sibling (fname + ".gz", produced
+    by `gzip -k9` next to the originals) when the client accepts gzip —
+    text/csv compresses roughly 5-10x. conditional=True makes Flask emit an
+    ETag and answer repeat fetches with 304 instead of the full body;
+    immutable seasons additionally get a year-long Cache-Control so repeat
+    views never reach the server at all.
+
+    With ACES_ACCEL_PREFIX set, the body transfer is handed off to nginx
+    via X-Accel-Redirect instead (nginx's gzip_static covers the .gz case).
     """
-    if not os.path.isdir(dir_path):
-        return None
-
-    latest_mtime = None
-    for fname in os.listdir(dir_path):
-        if not fname.lower().endswith(".csv"):
-            continue
-        full_path = os.path.join(dir_path, fname)
-        try:
-            mtime = os.path.getmtime(full_path)
-        except OSError:
-            continue
-        if latest_mtime is None or mtime > latest_mtime:
-            latest_mtime = mtime
+    cache_control = _CACHE_IMMUTABLE if immutable else _CACHE_LIVE
+
+    if ACCEL_PREFIX:
+        rel = os.path.relpath(os.path.join(dir_path, fname), DATA_DIR)
+        return Response(
+            headers={
+                "X-Accel-Redirect": f"{ACCEL_PREFIX}/{rel}",
+                "Content-Type": "text/csv",
+                "Cache-Control": cache_control,
+            }
+        )
+
+    if "gzip" in request.accept_encodings and _gz_is_fresh(
+        os.path.join(dir_path, fname)
+    ):
+        resp = send_from_directory(
+            dir_path,
+            fname + ".gz",
+            mimetype="text/csv",
+            conditional=True,
+        )
+        resp.headers["Content-Encoding"] = "gzip"
+        resp.headers["Vary"] = "Accept-Encoding"
+        resp.headers["Cache-Control"] = cache_control
+        return resp
+
+    resp = send_from_directory(
+        dir_path,
+        fname,
+        mimetype="text/csv",
+        conditional=True,
+    )
+    resp.headers["Cache-Control"] = cache_control
+    return resp
 
-    if latest_mtime is None:
-        return None
 
-    dt = datetime.fromtimestamp(latest_mtime, tz=timezone.utc)
-    return dt.isoformat()  # e.g. "2025-11-29T03:12:34.567890+00:00"
+@lru_cache(maxsize=8)
+def _iso_from_mtime(mtime: float) -> str:
+    """mtime -> ISO 8601 UTC, cached: pollers hit the last-updated
+    endpoints far more often than the underlying CSVs change."""
+    return datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
 
 
-# ----- Page routes (all protected) -----
+@lru_cache(maxsize=8)
+def _last_updated_body(latest_mtime) -> bytes:
+    """Serialized {"last_updated": ...} payload, rendered once per
+    distinct mtime; the body only ever changes when a CSV is rewritten."""
+    # e.g. "2025-11-29T03:12:34.567890+00:00"
+    ts = _iso_from_mtime(latest_mtime) if latest_mtime is not None else None
+    payload = {"last_updated": ts}
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
 
-@app.route("/")
-@requires_auth
-def index():
-    return send_from_directory(STATIC_DIR, "team-hitting.html")
 
+def _last_updated_response(dir_path: str, prefix: str = ""):
+    """
+    JSON {"last_updated": <ISO 8601 UTC or None>} for the newest CSV in
+    dir_path. Dashboard pollers hit these endpoints repeatedly, so the
+    response carries an mtime-derived ETag, collapses to an empty 304
+    when nothing changed, and serves pre-rendered bytes when it doesn't.
+    Passing the same prefix as the season routes shares their cached
+    directory scan.
+    """
+    latest_mtime = _scan_season_dir(dir_path, prefix)[1]
+    etag = hex(int(latest_mtime)) if latest_mtime is not None else "empty"
 
-@app.route("/team-hitting.html")
-@requires_auth
-def page_team_hitting():
-    return send_from_directory(STATIC_DIR, "team-hitting.html")
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        resp = Response(_last_updated_body(latest_mtime), mimetype="application/json")
 
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = _CACHE_LIVE
+    return resp
 
-@app.route("/team-pitching.html")
-@requires_auth
-def page_team_pitching():
-    return send_from_directory(STATIC_DIR, "team-pitching.html")
 
+# ----- Page routes (all protected) -----
 
-@app.route("/player.html")
-@requires_auth
-def page_player():
-    return send_from_directory(STATIC_DIR, "player.html")
+# One shared view per page instead of five identical handler functions;
+# "/" serves the hitting page as before.
+PAGES = {
+    "/": "team-hitting.html",
+    "/team-hitting.html": "team-hitting.html",
+    "/team-pitching.html": "team-pitching.html",
+    "/player.html": "player.html",
+    "/tournament.html": "tournament.html",
+}
+
+for _rule, _page in PAGES.items():
+    app.add_url_rule(
+        _rule,
+        endpoint=f"page:{_rule}",
+        view_func=requires_auth(partial(_send_static, _page)),
+    )
 
 
-@app.route("/tournament.html")
-@requires_auth
-def page_tournament():
-    return send_from_directory(STATIC_DIR, "tournament.html")
+# --- Hitting ---
 
+hitting_bp = Blueprint("hitting", __name__, url_prefix="/api/hitting")
 
-# --- Hitting ---
 
-@app.get("/api/hitting/seasons")
+@hitting_bp.get("/seasons")
 @requires_auth
 def hitting_seasons():
-    index = _build_season_index(HITTING_DIR, "hitting_")
-    return jsonify(_season_list_from_index(index))
+    return _json_response(_scan_season_dir(HITTING_DIR, "hitting_")[2])
 
 
-@app.get("/api/hitting/csv/<season_id>")
+@hitting_bp.get("/csv/<season_id>")
 @requires_auth
 def hitting_csv(season_id):
     index = _build_season_index(HITTING_DIR, "hitting_")
@@ -191,30 +432,29 @@ def hitting_csv(season_id):
     if not fname:
         abort(404, description=f"No hitting CSV found for season '{season_id}'")
 
-    return send_from_directory(
-        HITTING_DIR,
-        fname,
-        mimetype="text/csv",
+    return _send_csv(
+        HITTING_DIR, fname, immutable=bool(CURRENT_SEASON) and key != CURRENT_SEASON
     )
 
 
-@app.get("/api/hitting/last-updated")
+@hitting_bp.get("/last-updated")
 @requires_auth
 def hitting_last_updated():
-    ts = _get_last_updated_for_dir(HITTING_DIR)
-    return jsonify({"last_updated": ts})
+    return _last_updated_response(HITTING_DIR, "hitting_")
 
 
 # --- Pitching ---
 
-@app.get("/api/pitching/seasons")
+pitching_bp = Blueprint("pitching", __name__, url_prefix="/api/pitching")
+
+
+@pitching_bp.get("/seasons")
 @requires_auth
 def pitching_seasons():
-    index = _build_season_index(PITCHING_DIR, "pitching_")
-    return jsonify(_season_list_from_index(index))
+    return _json_response(_scan_season_dir(PITCHING_DIR, "pitching_")[2])
 
 
-@app.get("/api/pitching/csv/<season_id>")
+@pitching_bp.get("/csv/<season_id>")
 @requires_auth
 def pitching_csv(season_id):
     index = _build_season_index(PITCHING_DIR, "pitching_")
@@ -224,45 +464,39 @@ def pitching_csv(season_id):
     if not fname:
         abort(404, description=f"No pitching CSV found for season '{season_id}'")
 
-    return send_from_directory(
-        PITCHING_DIR,
-        fname,
-        mimetype="text/csv",
+    return _send_csv(
+        PITCHING_DIR, fname, immutable=bool(CURRENT_SEASON) and key != CURRENT_SEASON
     )
 
 
-@app.get("/api/pitching/last-updated")
+@pitching_bp.get("/last-updated")
 @requires_auth
 def pitching_last_updated():
-    ts = _get_last_updated_for_dir(PITCHING_DIR)
-    return jsonify({"last_updated": ts})
+    return _last_updated_response(PITCHING_DIR, "pitching_")
 
 
 # --- Tournament ---
 
-@app.get("/api/tournament.csv")
-@requires_auth
-def tournament_csv():
-    if not os.path.isdir(TOURNAMENT_DIR):
-        abort(404, description="Tournament directory not found")
+tournament_bp = Blueprint("tournament", __name__, url_prefix="/api")
 
-    filename = "tournament_teams.csv"
-    path = os.path.join(TOURNAMENT_DIR, filename)
-    if not os.path.exists(path):
-        abort(404, description="Tournament CSV not found")
 
-    return send_from_directory(
-        TOURNAMENT_DIR,
-        filename,
-        mimetype="text/csv",
-    )
+@tournament_bp.get("/tournament.csv")
+@requires_auth
+def tournament_csv():
+    # No pre-flight isdir/exists probes: send_from_directory stats the
+    # file once and 404s on its own if it (or the directory) is missing.
+    return _send_csv(TOURNAMENT_DIR, "tournament_teams.csv")
 
 
-@app.get("/api/tournament/last-updated")
+@tournament_bp.get("/tournament/last-updated")
 @requires_auth
 def tournament_last_updated():
-    ts = _get_last_updated_for_dir(TOURNAMENT_DIR)
-    return jsonify({"last_updated": ts})
+    return _last_updated_response(TOURNAMENT_DIR)
+
+
+app.register_blueprint(hitting_bp)
+app.register_blueprint(pitching_bp)
+app.register_blueprint(tournament_bp)
 
 
 # --- Protected static files (HTML / JS / CSS / assets) ---
@@ -270,8 +504,18 @@ def tournament_last_updated():
 @app.route("/<path:filename>")
 @requires_auth
 def static_files(filename):
-    return send_from_directory(STATIC_DIR, filename)
+    return _send_static(filename)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    # Local dev only. In production run under gunicorn:
+    #   gunicorn -c gunicorn.conf.py server:app
+    # fronted by nginx (see ACES_ACCEL_PREFIX above for CSV offload).
+    # Loopback-bound and threaded so a page load's asset fetches can
+    # overlap; the reloader/debugger only come on with ACES_DEBUG=1.
+    app.run(
+        host="127.0.0.1",
+        port=8000,
+        threaded=True,
+        debug=os.environ.get("ACES_DEBUG") == "1",
+    )
@@ -0,0 +1,81 @@
+"""
+Check that the pandas-vectorized box-score classifier produces exactly the
+same batting/pitching rows as the scalar loop, and that every numeric value
+is a plain Python int — pyodbc rejects numpy scalars at bind time, so an
+int64 leaking out of the vectorized path silently drops the whole game at
+the db_writer savepoint.
+
+Run directly: python test_box_score_classify.py
+"""
+import scrape_gc_schedules as sgs
+
+
+def build_rows():
+    rows = []
+    # Batting-style rows at every width the grid produces (7..12 cells),
+    # with messy whitespace to exercise normalization.
+    for i in range(80):
+        full = [
+            f"  Player   {i} ", str(i % 5), "1", "2", "0", "1", str(i % 3),
+            "0", "0", "1", "0", "4",
+        ]
+        rows.append(full[: 7 + (i % 6)])
+    # Pitching rows carry an innings value with a decimal point.
+    rows.append(["Ace  Arm", "4.2", "3", "1", "1", "2", "7", "68", "41", "19"])
+    rows.append(["Relief Guy", "1.0", "0", "0", "0", "1", "2"])
+    # Too-short and empty rows must be skipped by both paths.
+    rows.append(["header junk"])
+    rows.append([])
+    return rows
+
+
+def check_native(rows, label):
+    for row in rows:
+        for key, val in row.items():
+            if val is not None and type(val).__module__ != "builtins":
+                raise AssertionError(
+                    f"{label}: {key}={val!r} is {type(val).__name__}, "
+                    "expected a builtin type"
+                )
+
+
+def main():
+    if sgs.pd is None:
+        print("[WARN] pandas not installed; no vectorized path to compare.")
+        return
+
+    rows = build_rows()
+    assert len(rows) >= sgs._VECTORIZE_MIN_ROWS, "fixture too small to vectorize"
+
+    vec_bat, vec_pit = sgs._classify_rows_vectorized(rows)
+
+    # Force the scalar loop by raising the threshold past the fixture size.
+    saved = sgs._VECTORIZE_MIN_ROWS
+    sgs._VECTORIZE_MIN_ROWS = len(rows) + 1
+    try:
+        scal_bat, scal_pit = sgs.classify_box_score_rows(rows, "test-game")
+    finally:
+        sgs._VECTORIZE_MIN_ROWS = saved
+
+    check_native(vec_bat + vec_pit, "vectorized")
+    check_native(scal_bat + scal_pit, "scalar")
+
+    if vec_bat != scal_bat:
+        for a, b in zip(vec_bat, scal_bat):
+            if a != b:
+                print("[ERROR] batting mismatch:", a, "!=", b)
+        raise AssertionError("vectorized batting rows differ from scalar")
+    if vec_pit != scal_pit:
+        for a, b in zip(vec_pit, scal_pit):
+            if a != b:
+                print("[ERROR] pitching mismatch:", a, "!=", b)
+        raise AssertionError("vectorized pitching rows differ from scalar")
+
+    print(
+        f"[SUCCESS] Paths agree: batting={len(vec_bat)}, "
+        f"pitching={len(vec_pit)}, all values native."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@ import os
 import pyodbc
 from dotenv import load_dotenv
 
+# Reuse of connections across pyodbc.connect calls; on by default but be
+# explicit — repeat connects then cost a pool checkout, not a handshake.
+pyodbc.pooling = True
+
 # Load same env file as scraper
 load_dotenv("scrape_gc.env")
 
@@ -16,17 +20,23 @@ conn_str = (
     "Encrypt=no;"
 )
 
-print("[INFO] Connecting with:")
-print(conn_str)
-
-try:
-    conn = pyodbc.connect(conn_str, timeout=5)
-    print("[SUCCESS] Connected!")
-    cursor = conn.cursor()
-    cursor.execute("SELECT DB_NAME();")
-    row = cursor.fetchone()
-    print("[RESULT] Query OK — DB name:", row[0])
-    conn.close()
-except Exception as e:
-    print("[ERROR] Could not connect:")
-    print(repr(e))
+
+def main():
+    print("[INFO] Connecting with:")
+    print(conn_str)
+
+    try:
+        conn = pyodbc.connect(conn_str, timeout=5)
+        print("[SUCCESS] Connected!")
+        cursor = conn.cursor()
+        cursor.execute("SELECT DB_NAME();")
+        row = cursor.fetchone()
+        print("[RESULT] Query OK — DB name:", row[0])
+        conn.close()
+    except Exception as e:
+        print("[ERROR] Could not connect:")
+        print(repr(e))
+
+
+if __name__ == "__main__":
+    main()